@@ -132,10 +132,13 @@ if __name__ == '__main__':
 
             # certaing modifications are needed to be applied for templates, so
             # verify correctness of produced code manually
+            # arithmetic templates apply operator to scalar values too, so numpy error model
+            # is used to get the same results as for arrays (e.g. inf on division by zero)
             for name in arithmetic_binops_symbols:
                 func_text = template_series_arithmetic_binop.replace('binop', name)
                 func_text = func_text.replace(' + ', f' {arithmetic_binops_symbols[name]} ')
-                func_text = func_text.replace('def ', f'@sdc_overload(operator.{name})\ndef ', 1)
+                func_text = func_text.replace(
+                    'def ', f'@sdc_overload(operator.{name}, jit_options={{\'error_model\': \'numpy\'}})\ndef ', 1)
                 file.write(f'\n\n{func_text}')
 
             for name in comparison_binops_symbols:
@@ -147,8 +150,17 @@ if __name__ == '__main__':
             for name in comparison_binops_symbols:
                 func_text = template_str_arr_comparison_binop.replace('comp_binop', name)
                 func_text = func_text.replace(' < ', f' {comparison_binops_symbols[name]} ')
+                # NA elements are not equal to anything, so for 'ne' NA check results in True
+                # (only result computing lines are modified, type checks must keep their conditions)
                 if name == 'ne':
-                    func_text = func_text.replace('and not', 'or')
+                    func_text = '\n'.join(
+                        line.replace('= not ', '= ').replace(' and ', ' or ') if 'result[i] = not ' in line else line
+                        for line in func_text.split('\n'))
+                # equality of string arrays elements is checked by their sizes first, no full compare is needed
+                func_text = func_text.replace('str_arr_items_compare(self, i, other, i) == 0',
+                                              'str_arr_items_equal(self, i, other, i)')
+                func_text = func_text.replace('str_arr_items_compare(self, i, other, i) != 0',
+                                              'not str_arr_items_equal(self, i, other, i)')
                 func_text = func_text.replace('def ', f'@sdc_overload(operator.{name})\ndef ', 1)
                 file.write(f'\n\n{func_text}')
 
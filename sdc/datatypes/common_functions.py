@@ -42,14 +42,12 @@ from numba import numpy_support
 
 import sdc
 from sdc.hiframes.api import isna
-from sdc.hiframes.pd_series_type import SeriesType
 from sdc.str_arr_type import string_array_type
 from sdc.str_arr_ext import (num_total_chars, append_string_array_to,
                              str_arr_is_na, pre_alloc_string_array, str_arr_set_na, string_array_type,
                              cp_str_list_to_array, create_str_arr_from_list, get_utf8_size)
 from sdc.utilities.utils import sdc_overload, sdc_register_jitable
-from sdc.utilities.sdc_typing_utils import (find_common_dtype_from_numpy_dtypes,
-                                            TypeChecker)
+from sdc.utilities.sdc_typing_utils import find_common_dtype_from_numpy_dtypes
 
 
 def hpat_arrays_append(A, B):
@@ -193,6 +191,19 @@ def _hpat_ensure_array_capacity(new_size, arr):
     return res
 
 
+@sdc_register_jitable
+def _sdc_argsort_stable(arr):
+    """ Function returning positions of numeric array elements in stable sorted order
+        Sorting is skipped if the array is already sorted, e.g. for time series or range-like indexes
+    """
+
+    for i in range(1, len(arr)):
+        if not arr[i - 1] <= arr[i]:
+            return numpy.argsort(arr, kind='mergesort')
+
+    return numpy.arange(len(arr))
+
+
 def sdc_join_series_indexes(left, right):
     pass
 
@@ -220,8 +231,8 @@ def sdc_join_series_indexes_overload(left, right):
                 joined = numpy.empty(est_total_size, numba_common_dtype)
 
                 # sort arrays saving the old positions
-                sorted_left = numpy.argsort(left, kind='mergesort')
-                sorted_right = numpy.argsort(right, kind='mergesort')
+                sorted_left = _sdc_argsort_stable(left)
+                sorted_right = _sdc_argsort_stable(right)
 
                 i, j, k = 0, 0, 0
                 while (i < lsize and j < rsize):
@@ -423,12 +434,16 @@ def sdc_check_indexes_equal(left, right):
     pass
 
 
-@sdc_overload(sdc_check_indexes_equal, jit_options={'parallel': False})
+@sdc_overload(sdc_check_indexes_equal, jit_options={'parallel': False}, inline='always')
 def sdc_check_indexes_equal_overload(A, B):
     """Function for checking arrays A and B of the same type are equal"""
 
     if isinstance(A, types.Array):
         def sdc_check_indexes_equal_numeric_impl(A, B):
+            # indexes of series derived from the same data usually refer to the same array
+            if A is B:
+                return True
+
             return numpy.array_equal(A, B)
         return sdc_check_indexes_equal_numeric_impl
 
@@ -437,6 +452,9 @@ def sdc_check_indexes_equal_overload(A, B):
             # TODO: replace with StringArrays comparison
             is_index_equal = (len(A) == len(B)
                               and num_total_chars(A) == num_total_chars(B))
+            if not is_index_equal:
+                return False
+
             for i in numpy.arange(len(A)):
                 if (A[i] != B[i]
                         or str_arr_is_na(A, i) is not str_arr_is_na(B, i)):
@@ -548,58 +566,6 @@ def _sdc_pandas_series_check_axis_overload(axis):
     return None
 
 
-def _sdc_pandas_series_align(series, other, size='max', finiteness=False):
-    """
-    Align series and other series by
-        size where size of output series is max/min size of input series
-        finiteness where all the infinite and matched finite values are replaced with nans, e.g.
-        series: [1., inf, inf, -1.,   0.] -> [1., nan, nan, -1.,   0.]
-        other:  [1., -1.,  0., 0.1, -0.1] -> [1., nan, nan, 0.1, -0.1]
-    """
-    pass
-
-
-@sdc_overload(_sdc_pandas_series_align, jit_options={'parallel': False})
-def _sdc_pandas_series_align_overload(series, other, size='max', finiteness=False):
-    ty_checker = TypeChecker('Function sdc.common_functions._sdc_pandas_series_align().')
-    ty_checker.check(series, SeriesType)
-    ty_checker.check(other, SeriesType)
-
-    str_types = (str, types.StringLiteral, types.UnicodeType, types.Omitted)
-    if not isinstance(size, str_types):
-        ty_checker.raise_exc(size, 'str', 'size')
-
-    if not isinstance(finiteness, (bool, types.Boolean, types.Omitted)):
-        ty_checker.raise_exc(finiteness, 'bool', 'finiteness')
-
-    def _sdc_pandas_series_align_impl(series, other, size='max', finiteness=False):
-        if size != 'max' and size != 'min':
-            raise ValueError("Function sdc.common_functions._sdc_pandas_series_align(). "
-                             "The object size\n expected: 'max' or 'min'")
-
-        arr, other_arr = series._data, other._data
-        arr_len, other_arr_len = len(arr), len(other_arr)
-        min_length = min(arr_len, other_arr_len)
-        length = max(arr_len, other_arr_len) if size == 'max' else min_length
-
-        aligned_arr = numpy.repeat([numpy.nan], length)
-        aligned_other_arr = numpy.repeat([numpy.nan], length)
-
-        for i in numba.prange(min_length):
-            if not finiteness or (numpy.isfinite(arr[i]) and numpy.isfinite(other_arr[i])):
-                aligned_arr[i] = arr[i]
-                aligned_other_arr[i] = other_arr[i]
-            else:
-                aligned_arr[i] = aligned_other_arr[i] = numpy.nan
-
-        aligned = pandas.Series(aligned_arr, name=series._name)
-        aligned_other = pandas.Series(aligned_other_arr, name=other._name)
-
-        return aligned, aligned_other
-
-    return _sdc_pandas_series_align_impl
-
-
 def _sdc_asarray(data):
     pass
 
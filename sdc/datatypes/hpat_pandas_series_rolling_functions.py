@@ -30,11 +30,9 @@ import pandas
 from functools import partial
 
 from numba import prange
-from numba.extending import register_jitable
-from numba.types import (float64, Boolean, Integer, NoneType, Number,
+from numba.types import (float64, int64, Boolean, Integer, NoneType, Number,
                          Omitted, StringLiteral, UnicodeType)
 
-from sdc.datatypes.common_functions import _sdc_pandas_series_align
 from sdc.datatypes.hpat_pandas_series_rolling_types import SeriesRollingType
 from sdc.hiframes.pd_series_type import SeriesType
 from sdc.utilities.prange_utils import parallel_chunks
@@ -43,7 +41,16 @@ from sdc.utilities.utils import sdc_overload_method, sdc_register_jitable
 
 
 # disabling parallel execution for rolling due to numba issue https://github.com/numba/numba/issues/5098
+# it is still used for rolling.apply() as user function is called in the loop
 sdc_rolling_overload = partial(sdc_overload_method, parallel=False)
+# rolling methods based on parallel_chunks keep independent window state per chunk,
+# so they follow the common parallel overloads configuration
+sdc_rolling_overload_parallel = sdc_overload_method
+
+# maximum ratio of the biggest sum of squares of shifted window values to the current sum of squared deviations,
+# rounding errors of the window sums are amplified by this ratio in variance (and by its square in kurtosis),
+# so the sums are recalculated for values shifted by the window center once it is exceeded
+RECENTER_RATIO = 1e2
 
 
 hpat_pandas_series_rolling_docstring_tmpl = """
@@ -100,251 +107,333 @@ def arr_apply(arr, func):
 
 
 @sdc_register_jitable
-def arr_corr(x, y):
-    """Calculate correlation of values"""
-    if len(x) == 0:
+def window_apply(arr, start, stop, minp, func, buffer):
+    """Apply function for window values copied to buffer with infinite values replaced by NaN"""
+    size = stop - start
+    if size < minp:
         return numpy.nan
 
-    return numpy.corrcoef(x, y)[0, 1]
+    window = buffer[:size]
+    for k in range(size):
+        value = arr[start + k]
+        window[k] = numpy.nan if numpy.isinf(value) else value
 
+    return arr_apply(window, func)
 
-@sdc_register_jitable
-def arr_nonnan_count(arr):
-    """Count non-NaN values"""
-    return len(arr) - numpy.isnan(arr).sum()
 
+@sdc_register_jitable(inline='always')
+def compensated_sum_add(value, result):
+    """
+    Add value to the sum compensated by Neumaier's algorithm.
+    Result is a pair of the sum and the compensation of lost low-order bits.
+    """
+    total, compensation = result
+    new_total = total + value
+    bigger = total if abs(total) >= abs(value) else value
+    smaller = value if abs(total) >= abs(value) else total
+    compensation += (bigger - new_total) + smaller
 
-@sdc_register_jitable
-def _moment(arr, moment):
-    mn = numpy.mean(arr)
-    s = numpy.power((arr - mn), moment)
+    return new_total, compensation
 
-    return numpy.mean(s)
 
+@sdc_register_jitable(inline='always')
+def pop_sum(value, nfinite, result):
+    """Calculate the window sum without old value."""
+    finite = numpy.isfinite(value)
+    nfinite -= int64(finite)
+    result = compensated_sum_add(-value if finite else 0., result)
 
-@sdc_register_jitable
-def arr_kurt(arr):
-    """Calculate unbiased kurtosis of values"""
-    n = len(arr)
-    if n < 4:
-        return numpy.nan
+    return nfinite, result
 
-    m2 = _moment(arr, 2)
-    m4 = _moment(arr, 4)
-    val = 0 if m2 == 0 else m4 / m2 ** 2.0
 
-    if (n > 2) & (m2 > 0):
-        val = 1.0/(n-2)/(n-3) * ((n**2-1.0)*m4/m2**2.0 - 3*(n-1)**2.0)
+@sdc_register_jitable(inline='always')
+def put_sum(value, nfinite, result):
+    """Calculate the window sum with new value."""
+    finite = numpy.isfinite(value)
+    nfinite += int64(finite)
+    result = compensated_sum_add(value if finite else 0., result)
 
-    return val
+    return nfinite, result
 
 
-@sdc_register_jitable
-def arr_max(arr):
-    """Calculate maximum of values"""
-    if len(arr) == 0:
-        return numpy.nan
+@sdc_register_jitable(inline='always')
+def pop_count(value, nfinite, result):
+    """Calculate the window count of non-NaN values without old value."""
+    nfinite -= int64(not numpy.isnan(value))
 
-    return arr.max()
+    return nfinite, result
 
 
-@sdc_register_jitable
-def arr_mean(arr):
-    """Calculate mean of values"""
-    if len(arr) == 0:
-        return numpy.nan
+@sdc_register_jitable(inline='always')
+def put_count(value, nfinite, result):
+    """Calculate the window count of non-NaN values with new value."""
+    nfinite += int64(not numpy.isnan(value))
 
-    return arr.mean()
+    return nfinite, result
 
 
-@sdc_register_jitable
-def arr_median(arr):
-    """Calculate median of values"""
-    if len(arr) == 0:
+@sdc_register_jitable(inline='always')
+def count_result(nfinite, minp, result):
+    """Get result count regardless of min periods."""
+    return float64(nfinite)
+
+
+@sdc_register_jitable(inline='always')
+def result_or_nan(nfinite, minp, result):
+    """Get result taking into account min periods."""
+    if nfinite < minp:
         return numpy.nan
 
-    return numpy.median(arr)
+    return result
 
 
-@sdc_register_jitable
-def arr_min(arr):
-    """Calculate minimum of values"""
-    if len(arr) == 0:
+@sdc_register_jitable(inline='always')
+def sum_result_or_nan(nfinite, minp, result):
+    """Get result compensated sum taking into account min periods."""
+    if nfinite < minp:
         return numpy.nan
 
-    return arr.min()
+    total, compensation = result
 
+    return total + compensation
 
-@sdc_register_jitable
-def arr_quantile(arr, q):
-    """Calculate quantile of values"""
-    if len(arr) == 0:
+
+@sdc_register_jitable(inline='always')
+def mean_result_or_nan(nfinite, minp, result):
+    """Get result mean taking into account min periods."""
+    # mean of empty window is NaN regardless of min periods, so both checks are
+    # merged into one comparison against loop invariant bound
+    if nfinite < max(minp, 1):
         return numpy.nan
 
-    return numpy.quantile(arr, q)
+    total, compensation = result
 
+    return (total + compensation) / nfinite
 
-@sdc_register_jitable
-def _moment(arr, moment):
-    mn = numpy.mean(arr)
-    s = numpy.power((arr - mn), moment)
 
-    return numpy.mean(s)
+@sdc_register_jitable(inline='always')
+def keep_center(arr, start, stop, nfinite, result):
+    """Keep the window result as is, it is not accumulated for shifted values."""
+    return result
 
 
 @sdc_register_jitable
-def arr_skew(arr):
-    """Calculate unbiased skewness of values"""
-    n = len(arr)
-    if n < 3:
-        return numpy.nan
-
-    m2 = _moment(arr, 2)
-    m3 = _moment(arr, 3)
-    val = 0 if m2 == 0 else m3 / m2 ** 1.5
+def window_center(arr, start, stop):
+    """Get the finite window value closest to the mean of finite window values, NaN if there are no such values."""
+    total = 0.
+    nfinite = 0
+    for idx in range(start, stop):
+        value = arr[idx]
+        if numpy.isfinite(value):
+            total += value
+            nfinite += 1
+
+    center = numpy.nan
+    if nfinite == 0:
+        return center
+
+    mean = total / nfinite
+    for idx in range(start, stop):
+        value = arr[idx]
+        if numpy.isfinite(value) and not abs(value - mean) >= abs(center - mean):
+            center = float64(value)
+
+    return center
+
+
+@sdc_register_jitable(inline='always')
+def sums_lost_precision(nfinite, s1, s2, peak):
+    """
+    Check whether the window sums of shifted values and their squares can no longer give precise variance,
+    i.e. rounding errors of the biggest sum of squares accumulated since the sums calculation
+    are comparable with the current sum of squared deviations (or the sums are not calculated yet).
+    """
+    return not peak <= RECENTER_RATIO * (s2 - s1 * s1 / nfinite)
 
-    if (n > 2) & (m2 > 0):
-        val = numpy.sqrt((n - 1.0) * n) / (n - 2.0) * m3 / m2 ** 1.5
 
-    return val
+@sdc_register_jitable(inline='always')
+def pop_var(value, nfinite, result):
+    """Calculate the window sums for variance without old value."""
+    if not numpy.isfinite(value):
+        return nfinite, result
 
+    shift, s1, s2, peak = result
+    x = value - shift
 
-@sdc_register_jitable
-def arr_std(arr, ddof):
-    """Calculate standard deviation of values"""
-    return arr_var(arr, ddof) ** 0.5
+    return nfinite - 1, (shift, s1 - x, s2 - x * x, peak)
 
 
-@sdc_register_jitable
-def arr_var(arr, ddof):
-    """Calculate unbiased variance of values"""
-    length = len(arr)
-    if length in [0, ddof]:
-        return numpy.nan
+@sdc_register_jitable(inline='always')
+def put_var(value, nfinite, result):
+    """Calculate the window sums for variance with new value."""
+    if not numpy.isfinite(value):
+        return nfinite, result
 
-    return numpy.var(arr) * length / (length - ddof)
+    shift, s1, s2, peak = result
+    x = value - shift
+    s2 += x * x
 
+    return nfinite + 1, (shift, s1 + x, s2, max(peak, s2))
 
-def gen_hpat_pandas_series_rolling_impl(rolling_func):
-    """Generate series rolling methods implementations based on input func"""
-    def impl(self):
-        win = self._window
-        minp = self._min_periods
 
-        input_series = self._data
-        input_arr = input_series._data
-        length = len(input_arr)
-        output_arr = numpy.empty(length, dtype=float64)
+@sdc_register_jitable
+def window_var_sums(arr, start, stop):
+    """Calculate the window sums for variance for values shifted by the window center."""
+    shift = window_center(arr, start, stop)
+    s1, s2 = 0., 0.
+    for idx in range(start, stop):
+        value = arr[idx]
+        if numpy.isfinite(value):
+            x = value - shift
+            s1 += x
+            s2 += x * x
+
+    return shift, s1, s2, s2
+
+
+@sdc_register_jitable(inline='always')
+def recenter_var(arr, start, stop, nfinite, result):
+    """
+    Recalculate the window sums for variance for values shifted by the window center
+    if the sums lost precision, e.g. after the values far from the current ones left the window.
+    """
+    _, s1, s2, peak = result
+    if nfinite == 0 or not sums_lost_precision(nfinite, s1, s2, peak):
+        return result
 
-        def apply_minp(arr, minp):
-            finite_arr = arr[numpy.isfinite(arr)]
-            if len(finite_arr) < minp:
-                return numpy.nan
-            else:
-                return rolling_func(finite_arr)
+    return window_var_sums(arr, start, stop)
 
-        boundary = min(win, length)
-        for i in prange(boundary):
-            arr_range = input_arr[:i + 1]
-            output_arr[i] = apply_minp(arr_range, minp)
 
-        for i in prange(boundary, length):
-            arr_range = input_arr[i + 1 - win:i + 1]
-            output_arr[i] = apply_minp(arr_range, minp)
+@sdc_register_jitable(inline='always')
+def var_result_or_nan(nfinite, minp, result, ddof):
+    """Get result unbiased variance taking into account min periods."""
+    if nfinite < minp or nfinite == 0 or nfinite == ddof:
+        return numpy.nan
 
-        return pandas.Series(output_arr, input_series._index, name=input_series._name)
+    _, s1, s2, _ = result
 
-    return impl
+    return max(s2 - s1 * s1 / nfinite, 0.) / (nfinite - ddof)
 
 
-def gen_hpat_pandas_series_rolling_ddof_impl(rolling_func):
-    """Generate series rolling methods implementations with parameter ddof"""
-    def impl(self, ddof=1):
-        win = self._window
-        minp = self._min_periods
+@sdc_register_jitable(inline='always')
+def std_result_or_nan(nfinite, minp, result, ddof):
+    """Get result standard deviation taking into account min periods."""
+    return var_result_or_nan(nfinite, minp, result, ddof) ** 0.5
 
-        input_series = self._data
-        input_arr = input_series._data
-        length = len(input_arr)
-        output_arr = numpy.empty(length, dtype=float64)
 
-        def apply_minp(arr, ddof, minp):
-            finite_arr = arr[numpy.isfinite(arr)]
-            if len(finite_arr) < minp:
-                return numpy.nan
-            else:
-                return rolling_func(finite_arr, ddof)
+@sdc_register_jitable(inline='always')
+def pop_moments(value, nfinite, result):
+    """Calculate the window power sums without old value."""
+    if not numpy.isfinite(value):
+        return nfinite, result
 
-        boundary = min(win, length)
-        for i in prange(boundary):
-            arr_range = input_arr[:i + 1]
-            output_arr[i] = apply_minp(arr_range, ddof, minp)
+    shift, s1, s2, s3, s4, peak = result
+    x = value - shift
+    x2 = x * x
 
-        for i in prange(boundary, length):
-            arr_range = input_arr[i + 1 - win:i + 1]
-            output_arr[i] = apply_minp(arr_range, ddof, minp)
+    return nfinite - 1, (shift, s1 - x, s2 - x2, s3 - x2 * x, s4 - x2 * x2, peak)
 
-        return pandas.Series(output_arr, input_series._index, name=input_series._name)
 
-    return impl
+@sdc_register_jitable(inline='always')
+def put_moments(value, nfinite, result):
+    """Calculate the window power sums with new value."""
+    if not numpy.isfinite(value):
+        return nfinite, result
 
+    shift, s1, s2, s3, s4, peak = result
+    x = value - shift
+    x2 = x * x
+    s2 += x2
 
-hpat_pandas_rolling_series_kurt_impl = register_jitable(
-    gen_hpat_pandas_series_rolling_impl(arr_kurt))
-hpat_pandas_rolling_series_max_impl = register_jitable(
-    gen_hpat_pandas_series_rolling_impl(arr_max))
-hpat_pandas_rolling_series_median_impl = register_jitable(
-    gen_hpat_pandas_series_rolling_impl(arr_median))
-hpat_pandas_rolling_series_min_impl = register_jitable(
-    gen_hpat_pandas_series_rolling_impl(arr_min))
-hpat_pandas_rolling_series_skew_impl = register_jitable(
-    gen_hpat_pandas_series_rolling_impl(arr_skew))
-hpat_pandas_rolling_series_std_impl = register_jitable(
-    gen_hpat_pandas_series_rolling_ddof_impl(arr_std))
-hpat_pandas_rolling_series_var_impl = register_jitable(
-    gen_hpat_pandas_series_rolling_ddof_impl(arr_var))
+    return nfinite + 1, (shift, s1 + x, s2, s3 + x2 * x, s4 + x2 * x2, max(peak, s2))
 
 
 @sdc_register_jitable
-def pop_sum(value, nfinite, result):
-    """Calculate the window sum without old value."""
-    if numpy.isfinite(value):
-        nfinite -= 1
-        result -= value
+def window_power_sums(arr, start, stop):
+    """Calculate the window power sums for values shifted by the window center."""
+    shift = window_center(arr, start, stop)
+    s1, s2, s3, s4 = 0., 0., 0., 0.
+    for idx in range(start, stop):
+        value = arr[idx]
+        if numpy.isfinite(value):
+            x = value - shift
+            x2 = x * x
+            s1 += x
+            s2 += x2
+            s3 += x2 * x
+            s4 += x2 * x2
+
+    return shift, s1, s2, s3, s4, s2
+
+
+@sdc_register_jitable(inline='always')
+def recenter_moments(arr, start, stop, nfinite, result):
+    """
+    Recalculate the window power sums for values shifted by the window center
+    if the sums lost precision, e.g. after the values far from the current ones left the window.
+    """
+    _, s1, s2, _, _, peak = result
+    if nfinite == 0 or not sums_lost_precision(nfinite, s1, s2, peak):
+        return result
 
-    return nfinite, result
+    return window_power_sums(arr, start, stop)
 
 
 @sdc_register_jitable
-def put_sum(value, nfinite, result):
-    """Calculate the window sum with new value."""
-    if numpy.isfinite(value):
-        nfinite += 1
-        result += value
+def central_moments(nfinite, result):
+    """Get the second, third and fourth central moments from the window power sums."""
+    _, s1, s2, s3, s4, _ = result
+    mean = s1 / nfinite
+    mean2 = mean * mean
+    e2 = s2 / nfinite
+    e3 = s3 / nfinite
+    e4 = s4 / nfinite
 
-    return nfinite, result
+    m2 = e2 - mean2
+    if m2 <= 1e-14 * e2 and numpy.isfinite(e2):
+        # variance is lost in rounding error, so window values are treated as equal
+        return 0., 0., 0.
+
+    m3 = e3 - 3 * mean * e2 + 2 * mean2 * mean
+    m4 = e4 - 4 * mean * e3 + 6 * mean2 * e2 - 3 * mean2 * mean2
+
+    return m2, m3, m4
 
 
 @sdc_register_jitable
-def result_or_nan(nfinite, minp, result):
-    """Get result taking into account min periods."""
-    if nfinite < minp:
+def kurt_result_or_nan(nfinite, minp, result):
+    """Get result kurtosis taking into account min periods."""
+    if nfinite < minp or nfinite < 4:
         return numpy.nan
 
-    return result
+    n = nfinite
+    m2, _, m4 = central_moments(nfinite, result)
+    val = 0 if m2 == 0 else m4 / m2 ** 2.0
+
+    if (n > 2) & (m2 > 0):
+        val = 1.0/(n-2)/(n-3) * ((n**2-1.0)*m4/m2**2.0 - 3*(n-1)**2.0)
+
+    return val
 
 
 @sdc_register_jitable
-def mean_result_or_nan(nfinite, minp, result):
-    """Get result mean taking into account min periods."""
-    if nfinite == 0 or nfinite < minp:
+def skew_result_or_nan(nfinite, minp, result):
+    """Get result skewness taking into account min periods."""
+    if nfinite < minp or nfinite < 3:
         return numpy.nan
 
-    return result / nfinite
+    n = nfinite
+    m2, m3, _ = central_moments(nfinite, result)
+    val = 0 if m2 == 0 else m3 / m2 ** 1.5
+
+    if (n > 2) & (m2 > 0):
+        val = numpy.sqrt((n - 1.0) * n) / (n - 2.0) * m3 / m2 ** 1.5
+
+    return val
 
 
 def gen_sdc_pandas_series_rolling_impl(pop, put, get_result=result_or_nan,
-                                       init_result=numpy.nan):
+                                       init_result=numpy.nan, recenter=keep_center):
     """Generate series rolling methods implementations based on pop/put funcs"""
     def impl(self):
         win = self._window
@@ -361,7 +450,7 @@ def gen_sdc_pandas_series_rolling_impl(pop, put, get_result=result_or_nan,
             nfinite = 0
             result = init_result
 
-            prelude_start = max(0, chunk.start - win + 1)
+            prelude_start = min(chunk.start, max(0, chunk.start - win + 1))
             prelude_stop = min(chunk.start, prelude_start + win)
 
             interlude_start = prelude_stop
@@ -374,6 +463,7 @@ def gen_sdc_pandas_series_rolling_impl(pop, put, get_result=result_or_nan,
             for idx in range(interlude_start, interlude_stop):
                 value = input_arr[idx]
                 nfinite, result = put(value, nfinite, result)
+                result = recenter(input_arr, prelude_start, idx + 1, nfinite, result)
                 output_arr[idx] = get_result(nfinite, minp, result)
 
             for idx in range(interlude_stop, chunk.stop):
@@ -381,6 +471,7 @@ def gen_sdc_pandas_series_rolling_impl(pop, put, get_result=result_or_nan,
                 pop_value = input_arr[idx - win]
                 nfinite, result = put(put_value, nfinite, result)
                 nfinite, result = pop(pop_value, nfinite, result)
+                result = recenter(input_arr, idx - win + 1, idx + 1, nfinite, result)
                 output_arr[idx] = get_result(nfinite, minp, result)
 
         return pandas.Series(output_arr, input_series._index,
@@ -388,10 +479,526 @@ def gen_sdc_pandas_series_rolling_impl(pop, put, get_result=result_or_nan,
     return impl
 
 
+def gen_sdc_pandas_series_rolling_ddof_impl(pop, put, get_result, init_result=numpy.nan, recenter=keep_center):
+    """Generate series rolling methods implementations with parameter ddof based on pop/put funcs"""
+    def impl(self, ddof=1):
+        win = self._window
+        minp = self._min_periods
+
+        input_series = self._data
+        input_arr = input_series._data
+        length = len(input_arr)
+        output_arr = numpy.empty(length, dtype=float64)
+
+        chunks = parallel_chunks(length)
+        for i in prange(len(chunks)):
+            chunk = chunks[i]
+            nfinite = 0
+            result = init_result
+
+            prelude_start = min(chunk.start, max(0, chunk.start - win + 1))
+            prelude_stop = min(chunk.start, prelude_start + win)
+
+            interlude_start = prelude_stop
+            interlude_stop = min(prelude_start + win, chunk.stop)
+
+            for idx in range(prelude_start, prelude_stop):
+                value = input_arr[idx]
+                nfinite, result = put(value, nfinite, result)
+
+            for idx in range(interlude_start, interlude_stop):
+                value = input_arr[idx]
+                nfinite, result = put(value, nfinite, result)
+                result = recenter(input_arr, prelude_start, idx + 1, nfinite, result)
+                output_arr[idx] = get_result(nfinite, minp, result, ddof)
+
+            for idx in range(interlude_stop, chunk.stop):
+                put_value = input_arr[idx]
+                pop_value = input_arr[idx - win]
+                nfinite, result = put(put_value, nfinite, result)
+                nfinite, result = pop(pop_value, nfinite, result)
+                result = recenter(input_arr, idx - win + 1, idx + 1, nfinite, result)
+                output_arr[idx] = get_result(nfinite, minp, result, ddof)
+
+        return pandas.Series(output_arr, input_series._index,
+                             name=input_series._name)
+    return impl
+
+
+@sdc_register_jitable(inline='always')
+def max_superseded(old_value, new_value):
+    """Check whether old value can no longer be the window maximum."""
+    return old_value <= new_value
+
+
+@sdc_register_jitable(inline='always')
+def min_superseded(old_value, new_value):
+    """Check whether old value can no longer be the window minimum."""
+    return old_value >= new_value
+
+
+def gen_sdc_pandas_series_rolling_minmax_impl(superseded):
+    """
+    Generate series rolling min/max implementations based on monotonic deque.
+    The deque keeps indices of finite window values which still can be the result,
+    so every value is put to and popped from the deque only once.
+    """
+    def impl(self):
+        win = self._window
+        minp = self._min_periods
+
+        input_series = self._data
+        input_arr = input_series._data
+        length = len(input_arr)
+        output_arr = numpy.empty(length, dtype=float64)
+
+        chunks = parallel_chunks(length)
+        for i in prange(len(chunks)):
+            chunk = chunks[i]
+            # ring buffer keeps one extra item as new value is put before old one is popped
+            capacity = win + 1
+            deque = numpy.empty(capacity, dtype=int64)
+            head = 0
+            size = 0
+            nfinite = 0
+
+            window_start = min(chunk.start, max(0, chunk.start - win + 1))
+            for idx in range(window_start, chunk.stop):
+                put_value = input_arr[idx]
+                if numpy.isfinite(put_value):
+                    nfinite += 1
+                    while size > 0 and superseded(input_arr[deque[(head + size - 1) % capacity]], put_value):
+                        size -= 1
+                    deque[(head + size) % capacity] = idx
+                    size += 1
+
+                pop_idx = idx - win
+                if pop_idx >= window_start:
+                    if numpy.isfinite(input_arr[pop_idx]):
+                        nfinite -= 1
+                    if size > 0 and deque[head] == pop_idx:
+                        head = (head + 1) % capacity
+                        size -= 1
+
+                if idx >= chunk.start:
+                    if size == 0 or nfinite < minp:
+                        output_arr[idx] = numpy.nan
+                    else:
+                        output_arr[idx] = input_arr[deque[head]]
+
+        return pandas.Series(output_arr, input_series._index,
+                             name=input_series._name)
+    return impl
+
+
+@sdc_register_jitable
+def rank_segment(input_arr, start, stop, ranks, ranked_values):
+    """Rank values of the array segment, so the window values can be counted by rank."""
+    order = numpy.argsort(input_arr[start:stop])
+    for rank in range(len(order)):
+        pos = order[rank]
+        ranks[pos] = rank
+        ranked_values[rank] = input_arr[start + pos]
+
+
+@sdc_register_jitable
+def rank_tree_update(tree, rank, delta):
+    """Change number of the window values with the rank in the Fenwick tree."""
+    pos = rank + 1
+    while pos < len(tree):
+        tree[pos] += delta
+        pos += pos & -pos
+
+
+@sdc_register_jitable
+def rank_tree_nth(tree, ranked_values, n):
+    """Get n-th smallest (starting from 0) window value by descending the Fenwick tree."""
+    pos = 0
+    remaining = n + 1
+    step = 1
+    while step * 2 < len(tree):
+        step *= 2
+
+    while step > 0:
+        if pos + step < len(tree) and tree[pos + step] < remaining:
+            pos += step
+            remaining -= tree[pos]
+        step //= 2
+
+    return ranked_values[pos]
+
+
+@sdc_register_jitable
+def median_result_or_nan(nfinite, minp, tree, ranked_values, quantile):
+    """Get median of the window values counted in the tree taking into account min periods, quantile is ignored."""
+    if nfinite == 0 or nfinite < minp:
+        return numpy.nan
+
+    middle = nfinite // 2
+    if nfinite % 2:
+        return rank_tree_nth(tree, ranked_values, middle)
+
+    return (rank_tree_nth(tree, ranked_values, middle - 1) + rank_tree_nth(tree, ranked_values, middle)) / 2
+
+
+@sdc_register_jitable
+def quantile_result_or_nan(nfinite, minp, tree, ranked_values, quantile):
+    """Get linearly interpolated quantile of the window values counted in the tree taking into account min periods."""
+    if nfinite == 0 or nfinite < minp:
+        return numpy.nan
+
+    rank = quantile * (nfinite - 1)
+    lower = int(numpy.floor(rank))
+    upper = min(lower + 1, nfinite - 1)
+    fraction = rank - lower
+
+    lower_value = rank_tree_nth(tree, ranked_values, lower)
+    upper_value = rank_tree_nth(tree, ranked_values, upper)
+
+    return lower_value * (1 - fraction) + upper_value * fraction
+
+
+def gen_sdc_rolling_sorted_kernel(get_result):
+    """
+    Generate rolling kernel based on order statistics of the window.
+    Values are ranked by blocks of window size together with the preceding window,
+    finite window values are counted by rank in the Fenwick tree.
+    So put/pop and n-th value search are O(log(W)) and ranking is amortized O(log(W)) per value.
+    """
+    def kernel(input_arr, win, minp, quantile):
+        length = len(input_arr)
+        output_arr = numpy.empty(length, dtype=float64)
+
+        chunks = parallel_chunks(length)
+        for i in prange(len(chunks)):
+            chunk = chunks[i]
+            window_start = min(chunk.start, max(0, chunk.start - win + 1))
+            span = chunk.stop - window_start
+
+            block = max(1, min(win, span))
+            capacity = block + min(win, span)
+            ranks = numpy.empty(capacity, dtype=int64)
+            ranked_values = numpy.empty(capacity, dtype=float64)
+            tree = numpy.empty(capacity + 1, dtype=int64)
+            nfinite = 0
+
+            for block_start in range(window_start, chunk.stop, block):
+                block_stop = min(block_start + block, chunk.stop)
+                # segment covers all values put to and popped from the window within the block
+                segment_start = max(window_start, block_start - win)
+                rank_segment(input_arr, segment_start, block_stop, ranks, ranked_values)
+
+                tree[:] = 0
+                for idx in range(segment_start, block_start):
+                    if numpy.isfinite(input_arr[idx]):
+                        rank_tree_update(tree, ranks[idx - segment_start], 1)
+
+                for idx in range(block_start, block_stop):
+                    if numpy.isfinite(input_arr[idx]):
+                        rank_tree_update(tree, ranks[idx - segment_start], 1)
+                        nfinite += 1
+
+                    pop_idx = idx - win
+                    if pop_idx >= window_start and numpy.isfinite(input_arr[pop_idx]):
+                        rank_tree_update(tree, ranks[pop_idx - segment_start], -1)
+                        nfinite -= 1
+
+                    if idx >= chunk.start:
+                        output_arr[idx] = get_result(nfinite, minp, tree, ranked_values, quantile)
+
+        return output_arr
+
+    return sdc_register_jitable(kernel)
+
+
+@sdc_register_jitable(inline='always')
+def keep_pairwise_center(main_arr, other_arr, start, stop, min_length, nfinite, result):
+    """Keep the window result as is, it is not accumulated for shifted values."""
+    return result
+
+
+@sdc_register_jitable(inline='always')
+def pop_corr(main_value, other_value, nfinite, result):
+    """Calculate the window sums for correlation without old pair of values."""
+    if not (numpy.isfinite(main_value) and numpy.isfinite(other_value)):
+        return nfinite, result
+
+    main_shift, other_shift, sx, sy, sxx, syy, sxy, main_peak, other_peak = result
+    x = main_value - main_shift
+    y = other_value - other_shift
+
+    return nfinite - 1, (main_shift, other_shift, sx - x, sy - y, sxx - x * x, syy - y * y, sxy - x * y,
+                         main_peak, other_peak)
+
+
+@sdc_register_jitable(inline='always')
+def put_corr(main_value, other_value, nfinite, result):
+    """Calculate the window sums for correlation with new pair of values."""
+    if not (numpy.isfinite(main_value) and numpy.isfinite(other_value)):
+        return nfinite, result
+
+    main_shift, other_shift, sx, sy, sxx, syy, sxy, main_peak, other_peak = result
+    x = main_value - main_shift
+    y = other_value - other_shift
+    sxx += x * x
+    syy += y * y
+
+    return nfinite + 1, (main_shift, other_shift, sx + x, sy + y, sxx, syy, sxy + x * y,
+                         max(main_peak, sxx), max(other_peak, syy))
+
+
+@sdc_register_jitable
+def window_pair_centers(main_arr, other_arr, start, stop):
+    """
+    Get the window values closest to the means of window values for pairs of finite values only,
+    NaNs if there are no such pairs.
+    """
+    main_total, other_total = 0., 0.
+    npairs = 0
+    for idx in range(start, stop):
+        main_value, other_value = main_arr[idx], other_arr[idx]
+        if numpy.isfinite(main_value) and numpy.isfinite(other_value):
+            main_total += main_value
+            other_total += other_value
+            npairs += 1
+
+    main_center, other_center = numpy.nan, numpy.nan
+    if npairs == 0:
+        return main_center, other_center
+
+    main_mean, other_mean = main_total / npairs, other_total / npairs
+    for idx in range(start, stop):
+        main_value, other_value = main_arr[idx], other_arr[idx]
+        if numpy.isfinite(main_value) and numpy.isfinite(other_value):
+            if not abs(main_value - main_mean) >= abs(main_center - main_mean):
+                main_center = float64(main_value)
+            if not abs(other_value - other_mean) >= abs(other_center - other_mean):
+                other_center = float64(other_value)
+
+    return main_center, other_center
+
+
+@sdc_register_jitable
+def window_corr_sums(main_arr, other_arr, start, stop, min_length):
+    """
+    Calculate the window sums for correlation for values shifted by the window centers.
+    Only pairs of finite values are taken into account.
+    """
+    stop = min(stop, min_length)
+    main_shift, other_shift = window_pair_centers(main_arr, other_arr, start, stop)
+    sx, sy, sxx, syy, sxy = 0., 0., 0., 0., 0.
+    for idx in range(start, stop):
+        main_value, other_value = main_arr[idx], other_arr[idx]
+        if numpy.isfinite(main_value) and numpy.isfinite(other_value):
+            x = main_value - main_shift
+            y = other_value - other_shift
+            sx += x
+            sy += y
+            sxx += x * x
+            syy += y * y
+            sxy += x * y
+
+    return main_shift, other_shift, sx, sy, sxx, syy, sxy, sxx, syy
+
+
+@sdc_register_jitable(inline='always')
+def recenter_corr(main_arr, other_arr, start, stop, min_length, nfinite, result):
+    """
+    Recalculate the window sums for correlation for values shifted by the window centers
+    if the sums lost precision, e.g. after the values far from the current ones left the window.
+    """
+    _, _, sx, sy, sxx, syy, _, main_peak, other_peak = result
+    if nfinite == 0 or not (sums_lost_precision(nfinite, sx, sxx, main_peak)
+                            or sums_lost_precision(nfinite, sy, syy, other_peak)):
+        return result
+
+    return window_corr_sums(main_arr, other_arr, start, stop, min_length)
+
+
+@sdc_register_jitable
+def corr_result_or_nan(nfinite, minp, result, ddof):
+    """Get result correlation taking into account min periods, ddof cancels out."""
+    # correlation of a single pair is undefined as its variances are zero
+    if nfinite < 2 or nfinite < minp:
+        return numpy.nan
+
+    _, _, sx, sy, sxx, syy, sxy, _, _ = result
+    main_mean = sx / nfinite
+    other_mean = sy / nfinite
+    main_var = sxx / nfinite - main_mean * main_mean
+    other_var = syy / nfinite - other_mean * other_mean
+    # correlation is undefined if variance of any window is lost in rounding error
+    if main_var <= 1e-14 * sxx / nfinite or other_var <= 1e-14 * syy / nfinite:
+        return numpy.nan
+
+    cov = sxy / nfinite - main_mean * other_mean
+    corr = cov / numpy.sqrt(main_var * other_var)
+
+    return min(max(corr, -1.), 1.)
+
+
+@sdc_register_jitable(inline='always')
+def pop_cov(main_value, other_value, nfinite, result):
+    """
+    Calculate the window sums for covariance without old pair of values.
+    Finite value without finite pair is taken into account in the mean of its series only.
+    """
+    npairs, pair_sums, main_count, main_sum, other_count, other_sum = result
+    npairs, pair_sums = pop_corr(main_value, other_value, npairs, pair_sums)
+    if not numpy.isfinite(other_value):
+        main_count, main_sum = pop_sum(main_value, main_count, main_sum)
+    if not numpy.isfinite(main_value):
+        other_count, other_sum = pop_sum(other_value, other_count, other_sum)
+    nfinite -= int64(not numpy.isnan(main_value + other_value))
+
+    return nfinite, (npairs, pair_sums, main_count, main_sum, other_count, other_sum)
+
+
+@sdc_register_jitable(inline='always')
+def put_cov(main_value, other_value, nfinite, result):
+    """
+    Calculate the window sums for covariance with new pair of values.
+    Finite value without finite pair is taken into account in the mean of its series only.
+    """
+    npairs, pair_sums, main_count, main_sum, other_count, other_sum = result
+    npairs, pair_sums = put_corr(main_value, other_value, npairs, pair_sums)
+    if not numpy.isfinite(other_value):
+        main_count, main_sum = put_sum(main_value, main_count, main_sum)
+    if not numpy.isfinite(main_value):
+        other_count, other_sum = put_sum(other_value, other_count, other_sum)
+    nfinite += int64(not numpy.isnan(main_value + other_value))
+
+    return nfinite, (npairs, pair_sums, main_count, main_sum, other_count, other_sum)
+
+
+@sdc_register_jitable(inline='always')
+def recenter_cov(main_arr, other_arr, start, stop, min_length, nfinite, result):
+    """
+    Recalculate the window sums for covariance of pairs of finite values shifted by the window centers
+    if the sums lost precision, e.g. after the values far from the current ones left the window.
+    """
+    npairs, pair_sums, main_count, main_sum, other_count, other_sum = result
+    pair_sums = recenter_corr(main_arr, other_arr, start, stop, min_length, npairs, pair_sums)
+
+    return npairs, pair_sums, main_count, main_sum, other_count, other_sum
+
+
+@sdc_register_jitable
+def cov_result_or_nan(nfinite, minp, result, ddof):
+    """Get result covariance taking into account min periods."""
+    npairs, pair_sums, main_count, main_sum, other_count, other_sum = result
+    if npairs < max(minp, 1):
+        return numpy.nan
+
+    if nfinite == ddof:
+        bias_adj = numpy.nan if nfinite == 0 else numpy.inf
+    else:
+        bias_adj = nfinite / (nfinite - ddof)
+
+    main_shift, other_shift, sx, sy, _, _, sxy, _, _ = pair_sums
+    main_mean = sx / npairs
+    other_mean = sy / npairs
+    cov = sxy / npairs - main_mean * other_mean
+
+    if main_count > 0 or other_count > 0:
+        # means of the series also include finite values without finite pair
+        main_total, main_compensation = main_sum
+        other_total, other_compensation = other_sum
+        main_sum_shifted = main_total + main_compensation - main_count * main_shift
+        other_sum_shifted = other_total + other_compensation - other_count * other_shift
+        main_series_mean = (sx + main_sum_shifted) / (npairs + main_count)
+        other_series_mean = (sy + other_sum_shifted) / (npairs + other_count)
+        cov += ((main_shift + main_mean) * (other_shift + other_mean)
+                - (main_shift + main_series_mean) * (other_shift + other_series_mean))
+
+    return cov * bias_adj
+
+
+@sdc_register_jitable(inline='always')
+def aligned_pair(main_arr, other_arr, idx, min_length, finiteness):
+    """
+    Get pair of values aligned by size and optionally by finiteness,
+    i.e. values out of the shortest array or not finite in any array are replaced with NaNs
+    """
+    if idx >= min_length:
+        return numpy.nan, numpy.nan
+
+    main_value = main_arr[idx]
+    other_value = other_arr[idx]
+    if finiteness and not (numpy.isfinite(main_value) and numpy.isfinite(other_value)):
+        return numpy.nan, numpy.nan
+
+    return float64(main_value), float64(other_value)
+
+
+def gen_sdc_rolling_pairwise_kernel(pop, put, get_result, init_result, recenter=keep_pairwise_center):
+    """
+    Generate rolling kernel over pair of arrays based on pop/put funcs,
+    so the window state is updated for both arrays in one pass
+    """
+    def kernel(main_arr, other_arr, win, minp, ddof, align_finiteness):
+        min_length = min(len(main_arr), len(other_arr))
+        length = max(len(main_arr), len(other_arr))
+        output_arr = numpy.empty(length, dtype=float64)
+
+        chunks = parallel_chunks(length)
+        for i in prange(len(chunks)):
+            chunk = chunks[i]
+            nfinite = 0
+            result = init_result
+
+            window_start = min(chunk.start, max(0, chunk.start - win + 1))
+            for idx in range(window_start, chunk.stop):
+                main_value, other_value = aligned_pair(main_arr, other_arr, idx, min_length, align_finiteness)
+                nfinite, result = put(main_value, other_value, nfinite, result)
+
+                pop_idx = idx - win
+                if pop_idx >= window_start:
+                    main_value, other_value = aligned_pair(main_arr, other_arr, pop_idx, min_length,
+                                                           align_finiteness)
+                    nfinite, result = pop(main_value, other_value, nfinite, result)
+
+                if idx >= chunk.start:
+                    result = recenter(main_arr, other_arr, max(window_start, idx - win + 1), idx + 1, min_length,
+                                      nfinite, result)
+                    output_arr[idx] = get_result(nfinite, minp, result, ddof)
+
+        return output_arr
+
+    return sdc_register_jitable(kernel)
+
+
+sdc_rolling_cov_kernel = gen_sdc_rolling_pairwise_kernel(
+    pop_cov, put_cov, cov_result_or_nan,
+    init_result=(0, (numpy.nan, numpy.nan, 0., 0., 0., 0., 0., 0., 0.), 0, (0., 0.), 0, (0., 0.)),
+    recenter=recenter_cov)
+sdc_rolling_corr_kernel = gen_sdc_rolling_pairwise_kernel(
+    pop_corr, put_corr, corr_result_or_nan, init_result=(numpy.nan, numpy.nan, 0., 0., 0., 0., 0., 0., 0.),
+    recenter=recenter_corr)
+sdc_rolling_median_kernel = gen_sdc_rolling_sorted_kernel(median_result_or_nan)
+sdc_rolling_quantile_kernel = gen_sdc_rolling_sorted_kernel(quantile_result_or_nan)
+
+
+sdc_pandas_series_rolling_count_impl = gen_sdc_pandas_series_rolling_impl(
+    pop_count, put_count, get_result=count_result, init_result=0.)
 sdc_pandas_series_rolling_mean_impl = gen_sdc_pandas_series_rolling_impl(
-    pop_sum, put_sum, get_result=mean_result_or_nan, init_result=0.)
+    pop_sum, put_sum, get_result=mean_result_or_nan, init_result=(0., 0.))
 sdc_pandas_series_rolling_sum_impl = gen_sdc_pandas_series_rolling_impl(
-    pop_sum, put_sum, init_result=0.)
+    pop_sum, put_sum, get_result=sum_result_or_nan, init_result=(0., 0.))
+sdc_pandas_series_rolling_std_impl = gen_sdc_pandas_series_rolling_ddof_impl(
+    pop_var, put_var, get_result=std_result_or_nan, init_result=(numpy.nan, 0., 0., 0.),
+    recenter=recenter_var)
+sdc_pandas_series_rolling_var_impl = gen_sdc_pandas_series_rolling_ddof_impl(
+    pop_var, put_var, get_result=var_result_or_nan, init_result=(numpy.nan, 0., 0., 0.),
+    recenter=recenter_var)
+sdc_pandas_series_rolling_kurt_impl = gen_sdc_pandas_series_rolling_impl(
+    pop_moments, put_moments, get_result=kurt_result_or_nan, init_result=(numpy.nan, 0., 0., 0., 0., 0.),
+    recenter=recenter_moments)
+sdc_pandas_series_rolling_skew_impl = gen_sdc_pandas_series_rolling_impl(
+    pop_moments, put_moments, get_result=skew_result_or_nan, init_result=(numpy.nan, 0., 0., 0., 0., 0.),
+    recenter=recenter_moments)
+sdc_pandas_series_rolling_max_impl = gen_sdc_pandas_series_rolling_minmax_impl(max_superseded)
+sdc_pandas_series_rolling_min_impl = gen_sdc_pandas_series_rolling_minmax_impl(min_superseded)
 
 
 @sdc_rolling_overload(SeriesRollingType, 'apply')
@@ -413,29 +1020,21 @@ def hpat_pandas_series_rolling_apply(self, func, raw=None):
         length = len(input_arr)
         output_arr = numpy.empty(length, dtype=float64)
 
-        def culc_apply(arr, func, minp):
-            finite_arr = arr.copy()
-            finite_arr[numpy.isinf(arr)] = numpy.nan
-            if len(finite_arr) < minp:
-                return numpy.nan
-            else:
-                return arr_apply(finite_arr, func)
-
-        boundary = min(win, length)
-        for i in prange(boundary):
-            arr_range = input_arr[:i + 1]
-            output_arr[i] = culc_apply(arr_range, func, minp)
+        # window values are copied to the same buffer on every step,
+        # so the loop is sequential
+        # buffer is float64 for any input dtype as pandas passes float64 windows to func
+        buffer = numpy.empty(win, dtype=float64)
 
-        for i in prange(boundary, length):
-            arr_range = input_arr[i + 1 - win:i + 1]
-            output_arr[i] = culc_apply(arr_range, func, minp)
+        for i in range(length):
+            start = max(0, i + 1 - win)
+            output_arr[i] = window_apply(input_arr, start, i + 1, minp, func, buffer)
 
         return pandas.Series(output_arr, input_series._index, name=input_series._name)
 
     return hpat_pandas_rolling_series_apply_impl
 
 
-@sdc_rolling_overload(SeriesRollingType, 'corr')
+@sdc_rolling_overload_parallel(SeriesRollingType, 'corr')
 def hpat_pandas_series_rolling_corr(self, other=None, pairwise=None):
 
     ty_checker = TypeChecker('Method rolling.corr().')
@@ -457,71 +1056,25 @@ def hpat_pandas_series_rolling_corr(self, other=None, pairwise=None):
         minp = self._min_periods
 
         main_series = self._data
-        main_arr = main_series._data
-        main_arr_length = len(main_arr)
-
         if nan_other == True:  # noqa
-            other_arr = main_arr
+            other_series = main_series
         else:
-            other_arr = other._data
-
-        other_arr_length = len(other_arr)
-        length = max(main_arr_length, other_arr_length)
-        output_arr = numpy.empty(length, dtype=float64)
-
-        def calc_corr(main, other, minp):
-            # align arrays `main` and `other` by size and finiteness
-            min_length = min(len(main), len(other))
-            main_valid_indices = numpy.isfinite(main[:min_length])
-            other_valid_indices = numpy.isfinite(other[:min_length])
-            valid = main_valid_indices & other_valid_indices
-
-            if len(main[valid]) < minp:
-                return numpy.nan
-            else:
-                return arr_corr(main[valid], other[valid])
-
-        for i in prange(min(win, length)):
-            main_arr_range = main_arr[:i + 1]
-            other_arr_range = other_arr[:i + 1]
-            output_arr[i] = calc_corr(main_arr_range, other_arr_range, minp)
+            other_series = other
 
-        for i in prange(win, length):
-            main_arr_range = main_arr[i + 1 - win:i + 1]
-            other_arr_range = other_arr[i + 1 - win:i + 1]
-            output_arr[i] = calc_corr(main_arr_range, other_arr_range, minp)
+        output_arr = sdc_rolling_corr_kernel(main_series._data, other_series._data, win, minp, 1, False)
 
         return pandas.Series(output_arr)
 
     return hpat_pandas_rolling_series_corr_impl
 
 
-@sdc_rolling_overload(SeriesRollingType, 'count')
+@sdc_rolling_overload_parallel(SeriesRollingType, 'count')
 def hpat_pandas_series_rolling_count(self):
 
     ty_checker = TypeChecker('Method rolling.count().')
     ty_checker.check(self, SeriesRollingType)
 
-    def hpat_pandas_rolling_series_count_impl(self):
-        win = self._window
-
-        input_series = self._data
-        input_arr = input_series._data
-        length = len(input_arr)
-        output_arr = numpy.empty(length, dtype=float64)
-
-        boundary = min(win, length)
-        for i in prange(boundary):
-            arr_range = input_arr[:i + 1]
-            output_arr[i] = arr_nonnan_count(arr_range)
-
-        for i in prange(boundary, length):
-            arr_range = input_arr[i + 1 - win:i + 1]
-            output_arr[i] = arr_nonnan_count(arr_range)
-
-        return pandas.Series(output_arr, input_series._index, name=input_series._name)
-
-    return hpat_pandas_rolling_series_count_impl
+    return sdc_pandas_series_rolling_count_impl
 
 
 def _hpat_pandas_series_rolling_cov_check_types(self, other=None,
@@ -556,43 +1109,15 @@ def _gen_hpat_pandas_rolling_series_cov_impl(other, align_finiteness=False):
         else:
             other_series = other
 
-        main_aligned, other_aligned = _sdc_pandas_series_align(main_series, other_series,
-                                                               finiteness=align_finiteness)
-        count = (main_aligned + other_aligned).rolling(win).count()
-        bias_adj = count / (count - ddof)
-
-        def mean(series):
-            # cannot call return series.rolling(win, min_periods=minp).mean()
-            # due to different float rounding in new and old implementations
-            # TODO: fix this during optimizing of covariance
-            input_arr = series._data
-            length = len(input_arr)
-            output_arr = numpy.empty(length, dtype=float64)
-
-            def apply_minp(arr, minp):
-                finite_arr = arr[numpy.isfinite(arr)]
-                if len(finite_arr) < minp:
-                    return numpy.nan
-                else:
-                    return arr_mean(finite_arr)
-
-            boundary = min(win, length)
-            for i in prange(boundary):
-                arr_range = input_arr[:i + 1]
-                output_arr[i] = apply_minp(arr_range, minp)
-
-            for i in prange(boundary, length):
-                arr_range = input_arr[i + 1 - win:i + 1]
-                output_arr[i] = apply_minp(arr_range, minp)
+        output_arr = sdc_rolling_cov_kernel(main_series._data, other_series._data, win, minp, ddof,
+                                            align_finiteness)
 
-            return pandas.Series(output_arr, series._index, name=series._name)
-
-        return (mean(main_aligned * other_aligned) - mean(main_aligned) * mean(other_aligned)) * bias_adj
+        return pandas.Series(output_arr)
 
     return _impl
 
 
-@sdc_rolling_overload(SeriesRollingType, 'cov')
+@sdc_rolling_overload_parallel(SeriesRollingType, 'cov')
 def hpat_pandas_series_rolling_cov(self, other=None, pairwise=None, ddof=1):
     _hpat_pandas_series_rolling_cov_check_types(self, other=other,
                                                 pairwise=pairwise, ddof=ddof)
@@ -600,7 +1125,7 @@ def hpat_pandas_series_rolling_cov(self, other=None, pairwise=None, ddof=1):
     return _gen_hpat_pandas_rolling_series_cov_impl(other, align_finiteness=True)
 
 
-@sdc_rolling_overload(SeriesRollingType, '_df_cov')
+@sdc_rolling_overload_parallel(SeriesRollingType, '_df_cov')
 def hpat_pandas_series_rolling_cov(self, other=None, pairwise=None, ddof=1):
     _hpat_pandas_series_rolling_cov_check_types(self, other=other,
                                                 pairwise=pairwise, ddof=ddof)
@@ -608,25 +1133,25 @@ def hpat_pandas_series_rolling_cov(self, other=None, pairwise=None, ddof=1):
     return _gen_hpat_pandas_rolling_series_cov_impl(other)
 
 
-@sdc_rolling_overload(SeriesRollingType, 'kurt')
+@sdc_rolling_overload_parallel(SeriesRollingType, 'kurt')
 def hpat_pandas_series_rolling_kurt(self):
 
     ty_checker = TypeChecker('Method rolling.kurt().')
     ty_checker.check(self, SeriesRollingType)
 
-    return hpat_pandas_rolling_series_kurt_impl
+    return sdc_pandas_series_rolling_kurt_impl
 
 
-@sdc_rolling_overload(SeriesRollingType, 'max')
+@sdc_rolling_overload_parallel(SeriesRollingType, 'max')
 def hpat_pandas_series_rolling_max(self):
 
     ty_checker = TypeChecker('Method rolling.max().')
     ty_checker.check(self, SeriesRollingType)
 
-    return hpat_pandas_rolling_series_max_impl
+    return sdc_pandas_series_rolling_max_impl
 
 
-@sdc_overload_method(SeriesRollingType, 'mean')
+@sdc_rolling_overload_parallel(SeriesRollingType, 'mean')
 def hpat_pandas_series_rolling_mean(self):
 
     ty_checker = TypeChecker('Method rolling.mean().')
@@ -635,25 +1160,34 @@ def hpat_pandas_series_rolling_mean(self):
     return sdc_pandas_series_rolling_mean_impl
 
 
-@sdc_rolling_overload(SeriesRollingType, 'median')
+@sdc_rolling_overload_parallel(SeriesRollingType, 'median')
 def hpat_pandas_series_rolling_median(self):
 
     ty_checker = TypeChecker('Method rolling.median().')
     ty_checker.check(self, SeriesRollingType)
 
+    def hpat_pandas_rolling_series_median_impl(self):
+        win = self._window
+        minp = self._min_periods
+
+        input_series = self._data
+        output_arr = sdc_rolling_median_kernel(input_series._data, win, minp, 0.5)
+
+        return pandas.Series(output_arr, input_series._index, name=input_series._name)
+
     return hpat_pandas_rolling_series_median_impl
 
 
-@sdc_rolling_overload(SeriesRollingType, 'min')
+@sdc_rolling_overload_parallel(SeriesRollingType, 'min')
 def hpat_pandas_series_rolling_min(self):
 
     ty_checker = TypeChecker('Method rolling.min().')
     ty_checker.check(self, SeriesRollingType)
 
-    return hpat_pandas_rolling_series_min_impl
+    return sdc_pandas_series_rolling_min_impl
 
 
-@sdc_rolling_overload(SeriesRollingType, 'quantile')
+@sdc_rolling_overload_parallel(SeriesRollingType, 'quantile')
 def hpat_pandas_series_rolling_quantile(self, quantile, interpolation='linear'):
 
     ty_checker = TypeChecker('Method rolling.quantile().')
@@ -676,41 +1210,23 @@ def hpat_pandas_series_rolling_quantile(self, quantile, interpolation='linear'):
         minp = self._min_periods
 
         input_series = self._data
-        input_arr = input_series._data
-        length = len(input_arr)
-        output_arr = numpy.empty(length, dtype=float64)
-
-        def calc_quantile(arr, quantile, minp):
-            finite_arr = arr[numpy.isfinite(arr)]
-            if len(finite_arr) < minp:
-                return numpy.nan
-            else:
-                return arr_quantile(finite_arr, quantile)
-
-        boundary = min(win, length)
-        for i in prange(boundary):
-            arr_range = input_arr[:i + 1]
-            output_arr[i] = calc_quantile(arr_range, quantile, minp)
-
-        for i in prange(boundary, length):
-            arr_range = input_arr[i + 1 - win:i + 1]
-            output_arr[i] = calc_quantile(arr_range, quantile, minp)
+        output_arr = sdc_rolling_quantile_kernel(input_series._data, win, minp, quantile)
 
         return pandas.Series(output_arr, input_series._index, name=input_series._name)
 
     return hpat_pandas_rolling_series_quantile_impl
 
 
-@sdc_rolling_overload(SeriesRollingType, 'skew')
+@sdc_rolling_overload_parallel(SeriesRollingType, 'skew')
 def hpat_pandas_series_rolling_skew(self):
 
     ty_checker = TypeChecker('Method rolling.skew().')
     ty_checker.check(self, SeriesRollingType)
 
-    return hpat_pandas_rolling_series_skew_impl
+    return sdc_pandas_series_rolling_skew_impl
 
 
-@sdc_rolling_overload(SeriesRollingType, 'std')
+@sdc_rolling_overload_parallel(SeriesRollingType, 'std')
 def hpat_pandas_series_rolling_std(self, ddof=1):
 
     ty_checker = TypeChecker('Method rolling.std().')
@@ -719,10 +1235,10 @@ def hpat_pandas_series_rolling_std(self, ddof=1):
     if not isinstance(ddof, (int, Integer, Omitted)):
         ty_checker.raise_exc(ddof, 'int', 'ddof')
 
-    return hpat_pandas_rolling_series_std_impl
+    return sdc_pandas_series_rolling_std_impl
 
 
-@sdc_overload_method(SeriesRollingType, 'sum')
+@sdc_rolling_overload_parallel(SeriesRollingType, 'sum')
 def hpat_pandas_series_rolling_sum(self):
 
     ty_checker = TypeChecker('Method rolling.sum().')
@@ -731,7 +1247,7 @@ def hpat_pandas_series_rolling_sum(self):
     return sdc_pandas_series_rolling_sum_impl
 
 
-@sdc_rolling_overload(SeriesRollingType, 'var')
+@sdc_rolling_overload_parallel(SeriesRollingType, 'var')
 def hpat_pandas_series_rolling_var(self, ddof=1):
 
     ty_checker = TypeChecker('Method rolling.var().')
@@ -740,7 +1256,7 @@ def hpat_pandas_series_rolling_var(self, ddof=1):
     if not isinstance(ddof, (int, Integer, Omitted)):
         ty_checker.raise_exc(ddof, 'int', 'ddof')
 
-    return hpat_pandas_rolling_series_var_impl
+    return sdc_pandas_series_rolling_var_impl
 
 
 hpat_pandas_series_rolling_apply.__doc__ = hpat_pandas_series_rolling_docstring_tmpl.format(**{
@@ -43,12 +43,12 @@ from sdc.utilities.sdc_typing_utils import (TypeChecker, check_index_is_numeric,
                                             find_common_dtype_from_numpy_dtypes)
 from sdc.datatypes.common_functions import (sdc_join_series_indexes, sdc_check_indexes_equal)
 from sdc.hiframes.pd_series_type import SeriesType
-from sdc.str_arr_ext import (string_array_type, str_arr_is_na)
+from sdc.str_arr_ext import (string_array_type, str_arr_is_na, str_arr_items_equal, str_arr_items_compare)
 from sdc.utilities.utils import sdc_overload
 from sdc.functions.numpy_like import astype
 
 
-@sdc_overload(operator.add)
+@sdc_overload(operator.add, jit_options={'error_model': 'numpy'})
 def sdc_pandas_series_operator_add(self, other):
     """
     Pandas Series operator :attr:`pandas.Series.add` implementation
@@ -77,7 +77,7 @@ def sdc_pandas_series_operator_add(self, other):
 
     _func_name = 'Operator add().'
 
-    ty_checker = TypeChecker('Operator add().')
+    ty_checker = TypeChecker(_func_name)
     self_is_series, other_is_series = isinstance(self, SeriesType), isinstance(other, SeriesType)
     if not (self_is_series or other_is_series):
         return None
@@ -112,41 +112,42 @@ def sdc_pandas_series_operator_add(self, other):
     if not operands_are_series:
         def _series_operator_add_scalar_impl(self, other):
             if self_is_series == True:  # noqa
+                scalar = numpy.float64(other)
                 result_data = numpy.empty(len(self._data), dtype=numpy.float64)
-                result_data[:] = self._data + numpy.float64(other)
+                for i in numba.prange(len(self._data)):
+                    result_data[i] = self._data[i] + scalar
                 return pandas.Series(result_data, index=self._index, name=self._name)
             else:
+                scalar = numpy.float64(self)
                 result_data = numpy.empty(len(other._data), dtype=numpy.float64)
-                result_data[:] = numpy.float64(self) + other._data
+                for i in numba.prange(len(other._data)):
+                    result_data[i] = scalar + other._data[i]
                 return pandas.Series(result_data, index=other._index, name=other._name)
 
         return _series_operator_add_scalar_impl
 
     else:   # both operands are numeric series
 
+        # numpy already produces float64 result if any of operands is float64, so no conversion is needed
+        result_is_float64 = self.dtype == types.float64 or other.dtype == types.float64
+
         # optimization for series with default indexes, that can be aligned differently
         if (isinstance(self.index, types.NoneType) and isinstance(other.index, types.NoneType)):
             def _series_operator_add_none_indexes_impl(self, other):
+                left_size, right_size = len(self._data), len(other._data)
+                if result_is_float64 == True:  # noqa
+                    if (left_size == right_size):
+                        return pandas.Series(self._data + other._data)
 
-                if (len(self._data) == len(other._data)):
-                    result_data = astype(self._data, numpy.float64)
-                    result_data = result_data + other._data
-                    return pandas.Series(result_data)
-                else:
-                    left_size, right_size = len(self._data), len(other._data)
-                    min_data_size = min(left_size, right_size)
-                    max_data_size = max(left_size, right_size)
-                    result_data = numpy.empty(max_data_size, dtype=numpy.float64)
-                    if (left_size == min_data_size):
-                        result_data[:min_data_size] = self._data
-                        result_data[min_data_size:] = numpy.nan
-                        result_data = result_data + other._data
-                    else:
-                        result_data[:min_data_size] = other._data
-                        result_data[min_data_size:] = numpy.nan
-                        result_data = self._data + result_data
+                # values are read as float64 (missing ones as NaN), so no conversion of operands is needed
+                max_data_size = max(left_size, right_size)
+                result_data = numpy.empty(max_data_size, dtype=numpy.float64)
+                for i in numba.prange(max_data_size):
+                    left_value = self._data[i] if i < left_size else numpy.nan
+                    right_value = other._data[i] if i < right_size else numpy.nan
+                    result_data[i] = left_value + right_value
 
-                    return pandas.Series(result_data)
+                return pandas.Series(result_data)
 
             return _series_operator_add_none_indexes_impl
         else:
@@ -157,15 +158,24 @@ def sdc_pandas_series_operator_add(self, other):
                 numba_index_common_dtype = find_common_dtype_from_numpy_dtypes(
                     [ty_left_index_dtype, ty_right_index_dtype], [])
 
+            # left index is used in result as-is if it already has common dtype
+            left_index_is_common = none_or_numeric_indexes and ty_left_index_dtype == numba_index_common_dtype
+
             def _series_operator_add_common_impl(self, other):
                 left_index, right_index = self.index, other.index
 
                 # check if indexes are equal and series don't have to be aligned
                 if sdc_check_indexes_equal(left_index, right_index):
-                    result_data = numpy.empty(len(self._data), dtype=numpy.float64)
-                    result_data[:] = self._data + other._data
+                    if result_is_float64 == True:  # noqa
+                        result_data = self._data + other._data
+                    else:
+                        result_data = numpy.empty(len(self._data), dtype=numpy.float64)
+                        for i in numba.prange(len(self._data)):
+                            result_data[i] = self._data[i] + other._data[i]
 
-                    if none_or_numeric_indexes == True:  # noqa
+                    if left_index_is_common == True:  # noqa
+                        result_index = left_index
+                    elif none_or_numeric_indexes == True:  # noqa
                         result_index = astype(left_index, numba_index_common_dtype)
                     else:
                         result_index = self._index
@@ -176,14 +186,13 @@ def sdc_pandas_series_operator_add(self, other):
                 joined_index, left_indexer, right_indexer = sdc_join_series_indexes(left_index, right_index)
 
                 result_size = len(joined_index)
-                left_values = numpy.empty(result_size, dtype=numpy.float64)
-                right_values = numpy.empty(result_size, dtype=numpy.float64)
+                result_data = numpy.empty(result_size, dtype=numpy.float64)
                 for i in numba.prange(result_size):
                     left_pos, right_pos = left_indexer[i], right_indexer[i]
-                    left_values[i] = self._data[left_pos] if left_pos != -1 else numpy.nan
-                    right_values[i] = other._data[right_pos] if right_pos != -1 else numpy.nan
+                    left_value = self._data[left_pos] if left_pos != -1 else numpy.nan
+                    right_value = other._data[right_pos] if right_pos != -1 else numpy.nan
+                    result_data[i] = left_value + right_value
 
-                result_data = left_values + right_values
                 return pandas.Series(result_data, joined_index)
 
             return _series_operator_add_common_impl
@@ -191,7 +200,7 @@ def sdc_pandas_series_operator_add(self, other):
     return None
 
 
-@sdc_overload(operator.sub)
+@sdc_overload(operator.sub, jit_options={'error_model': 'numpy'})
 def sdc_pandas_series_operator_sub(self, other):
     """
     Pandas Series operator :attr:`pandas.Series.sub` implementation
@@ -220,7 +229,7 @@ def sdc_pandas_series_operator_sub(self, other):
 
     _func_name = 'Operator sub().'
 
-    ty_checker = TypeChecker('Operator sub().')
+    ty_checker = TypeChecker(_func_name)
     self_is_series, other_is_series = isinstance(self, SeriesType), isinstance(other, SeriesType)
     if not (self_is_series or other_is_series):
         return None
@@ -255,41 +264,42 @@ def sdc_pandas_series_operator_sub(self, other):
     if not operands_are_series:
         def _series_operator_sub_scalar_impl(self, other):
             if self_is_series == True:  # noqa
+                scalar = numpy.float64(other)
                 result_data = numpy.empty(len(self._data), dtype=numpy.float64)
-                result_data[:] = self._data - numpy.float64(other)
+                for i in numba.prange(len(self._data)):
+                    result_data[i] = self._data[i] - scalar
                 return pandas.Series(result_data, index=self._index, name=self._name)
             else:
+                scalar = numpy.float64(self)
                 result_data = numpy.empty(len(other._data), dtype=numpy.float64)
-                result_data[:] = numpy.float64(self) - other._data
+                for i in numba.prange(len(other._data)):
+                    result_data[i] = scalar - other._data[i]
                 return pandas.Series(result_data, index=other._index, name=other._name)
 
         return _series_operator_sub_scalar_impl
 
     else:   # both operands are numeric series
 
+        # numpy already produces float64 result if any of operands is float64, so no conversion is needed
+        result_is_float64 = self.dtype == types.float64 or other.dtype == types.float64
+
         # optimization for series with default indexes, that can be aligned differently
         if (isinstance(self.index, types.NoneType) and isinstance(other.index, types.NoneType)):
             def _series_operator_sub_none_indexes_impl(self, other):
+                left_size, right_size = len(self._data), len(other._data)
+                if result_is_float64 == True:  # noqa
+                    if (left_size == right_size):
+                        return pandas.Series(self._data - other._data)
 
-                if (len(self._data) == len(other._data)):
-                    result_data = astype(self._data, numpy.float64)
-                    result_data = result_data - other._data
-                    return pandas.Series(result_data)
-                else:
-                    left_size, right_size = len(self._data), len(other._data)
-                    min_data_size = min(left_size, right_size)
-                    max_data_size = max(left_size, right_size)
-                    result_data = numpy.empty(max_data_size, dtype=numpy.float64)
-                    if (left_size == min_data_size):
-                        result_data[:min_data_size] = self._data
-                        result_data[min_data_size:] = numpy.nan
-                        result_data = result_data - other._data
-                    else:
-                        result_data[:min_data_size] = other._data
-                        result_data[min_data_size:] = numpy.nan
-                        result_data = self._data - result_data
+                # values are read as float64 (missing ones as NaN), so no conversion of operands is needed
+                max_data_size = max(left_size, right_size)
+                result_data = numpy.empty(max_data_size, dtype=numpy.float64)
+                for i in numba.prange(max_data_size):
+                    left_value = self._data[i] if i < left_size else numpy.nan
+                    right_value = other._data[i] if i < right_size else numpy.nan
+                    result_data[i] = left_value - right_value
 
-                    return pandas.Series(result_data)
+                return pandas.Series(result_data)
 
             return _series_operator_sub_none_indexes_impl
         else:
@@ -300,15 +310,24 @@ def sdc_pandas_series_operator_sub(self, other):
                 numba_index_common_dtype = find_common_dtype_from_numpy_dtypes(
                     [ty_left_index_dtype, ty_right_index_dtype], [])
 
+            # left index is used in result as-is if it already has common dtype
+            left_index_is_common = none_or_numeric_indexes and ty_left_index_dtype == numba_index_common_dtype
+
             def _series_operator_sub_common_impl(self, other):
                 left_index, right_index = self.index, other.index
 
                 # check if indexes are equal and series don't have to be aligned
                 if sdc_check_indexes_equal(left_index, right_index):
-                    result_data = numpy.empty(len(self._data), dtype=numpy.float64)
-                    result_data[:] = self._data - other._data
+                    if result_is_float64 == True:  # noqa
+                        result_data = self._data - other._data
+                    else:
+                        result_data = numpy.empty(len(self._data), dtype=numpy.float64)
+                        for i in numba.prange(len(self._data)):
+                            result_data[i] = self._data[i] - other._data[i]
 
-                    if none_or_numeric_indexes == True:  # noqa
+                    if left_index_is_common == True:  # noqa
+                        result_index = left_index
+                    elif none_or_numeric_indexes == True:  # noqa
                         result_index = astype(left_index, numba_index_common_dtype)
                     else:
                         result_index = self._index
@@ -319,14 +338,13 @@ def sdc_pandas_series_operator_sub(self, other):
                 joined_index, left_indexer, right_indexer = sdc_join_series_indexes(left_index, right_index)
 
                 result_size = len(joined_index)
-                left_values = numpy.empty(result_size, dtype=numpy.float64)
-                right_values = numpy.empty(result_size, dtype=numpy.float64)
+                result_data = numpy.empty(result_size, dtype=numpy.float64)
                 for i in numba.prange(result_size):
                     left_pos, right_pos = left_indexer[i], right_indexer[i]
-                    left_values[i] = self._data[left_pos] if left_pos != -1 else numpy.nan
-                    right_values[i] = other._data[right_pos] if right_pos != -1 else numpy.nan
+                    left_value = self._data[left_pos] if left_pos != -1 else numpy.nan
+                    right_value = other._data[right_pos] if right_pos != -1 else numpy.nan
+                    result_data[i] = left_value - right_value
 
-                result_data = left_values - right_values
                 return pandas.Series(result_data, joined_index)
 
             return _series_operator_sub_common_impl
@@ -334,7 +352,7 @@ def sdc_pandas_series_operator_sub(self, other):
     return None
 
 
-@sdc_overload(operator.mul)
+@sdc_overload(operator.mul, jit_options={'error_model': 'numpy'})
 def sdc_pandas_series_operator_mul(self, other):
     """
     Pandas Series operator :attr:`pandas.Series.mul` implementation
@@ -363,7 +381,7 @@ def sdc_pandas_series_operator_mul(self, other):
 
     _func_name = 'Operator mul().'
 
-    ty_checker = TypeChecker('Operator mul().')
+    ty_checker = TypeChecker(_func_name)
     self_is_series, other_is_series = isinstance(self, SeriesType), isinstance(other, SeriesType)
     if not (self_is_series or other_is_series):
         return None
@@ -398,41 +416,42 @@ def sdc_pandas_series_operator_mul(self, other):
     if not operands_are_series:
         def _series_operator_mul_scalar_impl(self, other):
             if self_is_series == True:  # noqa
+                scalar = numpy.float64(other)
                 result_data = numpy.empty(len(self._data), dtype=numpy.float64)
-                result_data[:] = self._data * numpy.float64(other)
+                for i in numba.prange(len(self._data)):
+                    result_data[i] = self._data[i] * scalar
                 return pandas.Series(result_data, index=self._index, name=self._name)
             else:
+                scalar = numpy.float64(self)
                 result_data = numpy.empty(len(other._data), dtype=numpy.float64)
-                result_data[:] = numpy.float64(self) * other._data
+                for i in numba.prange(len(other._data)):
+                    result_data[i] = scalar * other._data[i]
                 return pandas.Series(result_data, index=other._index, name=other._name)
 
         return _series_operator_mul_scalar_impl
 
     else:   # both operands are numeric series
 
+        # numpy already produces float64 result if any of operands is float64, so no conversion is needed
+        result_is_float64 = self.dtype == types.float64 or other.dtype == types.float64
+
         # optimization for series with default indexes, that can be aligned differently
         if (isinstance(self.index, types.NoneType) and isinstance(other.index, types.NoneType)):
             def _series_operator_mul_none_indexes_impl(self, other):
+                left_size, right_size = len(self._data), len(other._data)
+                if result_is_float64 == True:  # noqa
+                    if (left_size == right_size):
+                        return pandas.Series(self._data * other._data)
 
-                if (len(self._data) == len(other._data)):
-                    result_data = astype(self._data, numpy.float64)
-                    result_data = result_data * other._data
-                    return pandas.Series(result_data)
-                else:
-                    left_size, right_size = len(self._data), len(other._data)
-                    min_data_size = min(left_size, right_size)
-                    max_data_size = max(left_size, right_size)
-                    result_data = numpy.empty(max_data_size, dtype=numpy.float64)
-                    if (left_size == min_data_size):
-                        result_data[:min_data_size] = self._data
-                        result_data[min_data_size:] = numpy.nan
-                        result_data = result_data * other._data
-                    else:
-                        result_data[:min_data_size] = other._data
-                        result_data[min_data_size:] = numpy.nan
-                        result_data = self._data * result_data
+                # values are read as float64 (missing ones as NaN), so no conversion of operands is needed
+                max_data_size = max(left_size, right_size)
+                result_data = numpy.empty(max_data_size, dtype=numpy.float64)
+                for i in numba.prange(max_data_size):
+                    left_value = self._data[i] if i < left_size else numpy.nan
+                    right_value = other._data[i] if i < right_size else numpy.nan
+                    result_data[i] = left_value * right_value
 
-                    return pandas.Series(result_data)
+                return pandas.Series(result_data)
 
             return _series_operator_mul_none_indexes_impl
         else:
@@ -443,15 +462,24 @@ def sdc_pandas_series_operator_mul(self, other):
                 numba_index_common_dtype = find_common_dtype_from_numpy_dtypes(
                     [ty_left_index_dtype, ty_right_index_dtype], [])
 
+            # left index is used in result as-is if it already has common dtype
+            left_index_is_common = none_or_numeric_indexes and ty_left_index_dtype == numba_index_common_dtype
+
             def _series_operator_mul_common_impl(self, other):
                 left_index, right_index = self.index, other.index
 
                 # check if indexes are equal and series don't have to be aligned
                 if sdc_check_indexes_equal(left_index, right_index):
-                    result_data = numpy.empty(len(self._data), dtype=numpy.float64)
-                    result_data[:] = self._data * other._data
+                    if result_is_float64 == True:  # noqa
+                        result_data = self._data * other._data
+                    else:
+                        result_data = numpy.empty(len(self._data), dtype=numpy.float64)
+                        for i in numba.prange(len(self._data)):
+                            result_data[i] = self._data[i] * other._data[i]
 
-                    if none_or_numeric_indexes == True:  # noqa
+                    if left_index_is_common == True:  # noqa
+                        result_index = left_index
+                    elif none_or_numeric_indexes == True:  # noqa
                         result_index = astype(left_index, numba_index_common_dtype)
                     else:
                         result_index = self._index
@@ -462,14 +490,13 @@ def sdc_pandas_series_operator_mul(self, other):
                 joined_index, left_indexer, right_indexer = sdc_join_series_indexes(left_index, right_index)
 
                 result_size = len(joined_index)
-                left_values = numpy.empty(result_size, dtype=numpy.float64)
-                right_values = numpy.empty(result_size, dtype=numpy.float64)
+                result_data = numpy.empty(result_size, dtype=numpy.float64)
                 for i in numba.prange(result_size):
                     left_pos, right_pos = left_indexer[i], right_indexer[i]
-                    left_values[i] = self._data[left_pos] if left_pos != -1 else numpy.nan
-                    right_values[i] = other._data[right_pos] if right_pos != -1 else numpy.nan
+                    left_value = self._data[left_pos] if left_pos != -1 else numpy.nan
+                    right_value = other._data[right_pos] if right_pos != -1 else numpy.nan
+                    result_data[i] = left_value * right_value
 
-                result_data = left_values * right_values
                 return pandas.Series(result_data, joined_index)
 
             return _series_operator_mul_common_impl
@@ -477,7 +504,7 @@ def sdc_pandas_series_operator_mul(self, other):
     return None
 
 
-@sdc_overload(operator.truediv)
+@sdc_overload(operator.truediv, jit_options={'error_model': 'numpy'})
 def sdc_pandas_series_operator_truediv(self, other):
     """
     Pandas Series operator :attr:`pandas.Series.truediv` implementation
@@ -506,7 +533,7 @@ def sdc_pandas_series_operator_truediv(self, other):
 
     _func_name = 'Operator truediv().'
 
-    ty_checker = TypeChecker('Operator truediv().')
+    ty_checker = TypeChecker(_func_name)
     self_is_series, other_is_series = isinstance(self, SeriesType), isinstance(other, SeriesType)
     if not (self_is_series or other_is_series):
         return None
@@ -541,41 +568,42 @@ def sdc_pandas_series_operator_truediv(self, other):
     if not operands_are_series:
         def _series_operator_truediv_scalar_impl(self, other):
             if self_is_series == True:  # noqa
+                scalar = numpy.float64(other)
                 result_data = numpy.empty(len(self._data), dtype=numpy.float64)
-                result_data[:] = self._data / numpy.float64(other)
+                for i in numba.prange(len(self._data)):
+                    result_data[i] = self._data[i] / scalar
                 return pandas.Series(result_data, index=self._index, name=self._name)
             else:
+                scalar = numpy.float64(self)
                 result_data = numpy.empty(len(other._data), dtype=numpy.float64)
-                result_data[:] = numpy.float64(self) / other._data
+                for i in numba.prange(len(other._data)):
+                    result_data[i] = scalar / other._data[i]
                 return pandas.Series(result_data, index=other._index, name=other._name)
 
         return _series_operator_truediv_scalar_impl
 
     else:   # both operands are numeric series
 
+        # numpy already produces float64 result if any of operands is float64, so no conversion is needed
+        result_is_float64 = self.dtype == types.float64 or other.dtype == types.float64
+
         # optimization for series with default indexes, that can be aligned differently
         if (isinstance(self.index, types.NoneType) and isinstance(other.index, types.NoneType)):
             def _series_operator_truediv_none_indexes_impl(self, other):
+                left_size, right_size = len(self._data), len(other._data)
+                if result_is_float64 == True:  # noqa
+                    if (left_size == right_size):
+                        return pandas.Series(self._data / other._data)
 
-                if (len(self._data) == len(other._data)):
-                    result_data = astype(self._data, numpy.float64)
-                    result_data = result_data / other._data
-                    return pandas.Series(result_data)
-                else:
-                    left_size, right_size = len(self._data), len(other._data)
-                    min_data_size = min(left_size, right_size)
-                    max_data_size = max(left_size, right_size)
-                    result_data = numpy.empty(max_data_size, dtype=numpy.float64)
-                    if (left_size == min_data_size):
-                        result_data[:min_data_size] = self._data
-                        result_data[min_data_size:] = numpy.nan
-                        result_data = result_data / other._data
-                    else:
-                        result_data[:min_data_size] = other._data
-                        result_data[min_data_size:] = numpy.nan
-                        result_data = self._data / result_data
+                # values are read as float64 (missing ones as NaN), so no conversion of operands is needed
+                max_data_size = max(left_size, right_size)
+                result_data = numpy.empty(max_data_size, dtype=numpy.float64)
+                for i in numba.prange(max_data_size):
+                    left_value = self._data[i] if i < left_size else numpy.nan
+                    right_value = other._data[i] if i < right_size else numpy.nan
+                    result_data[i] = left_value / right_value
 
-                    return pandas.Series(result_data)
+                return pandas.Series(result_data)
 
             return _series_operator_truediv_none_indexes_impl
         else:
@@ -586,15 +614,24 @@ def sdc_pandas_series_operator_truediv(self, other):
                 numba_index_common_dtype = find_common_dtype_from_numpy_dtypes(
                     [ty_left_index_dtype, ty_right_index_dtype], [])
 
+            # left index is used in result as-is if it already has common dtype
+            left_index_is_common = none_or_numeric_indexes and ty_left_index_dtype == numba_index_common_dtype
+
             def _series_operator_truediv_common_impl(self, other):
                 left_index, right_index = self.index, other.index
 
                 # check if indexes are equal and series don't have to be aligned
                 if sdc_check_indexes_equal(left_index, right_index):
-                    result_data = numpy.empty(len(self._data), dtype=numpy.float64)
-                    result_data[:] = self._data / other._data
+                    if result_is_float64 == True:  # noqa
+                        result_data = self._data / other._data
+                    else:
+                        result_data = numpy.empty(len(self._data), dtype=numpy.float64)
+                        for i in numba.prange(len(self._data)):
+                            result_data[i] = self._data[i] / other._data[i]
 
-                    if none_or_numeric_indexes == True:  # noqa
+                    if left_index_is_common == True:  # noqa
+                        result_index = left_index
+                    elif none_or_numeric_indexes == True:  # noqa
                         result_index = astype(left_index, numba_index_common_dtype)
                     else:
                         result_index = self._index
@@ -605,14 +642,13 @@ def sdc_pandas_series_operator_truediv(self, other):
                 joined_index, left_indexer, right_indexer = sdc_join_series_indexes(left_index, right_index)
 
                 result_size = len(joined_index)
-                left_values = numpy.empty(result_size, dtype=numpy.float64)
-                right_values = numpy.empty(result_size, dtype=numpy.float64)
+                result_data = numpy.empty(result_size, dtype=numpy.float64)
                 for i in numba.prange(result_size):
                     left_pos, right_pos = left_indexer[i], right_indexer[i]
-                    left_values[i] = self._data[left_pos] if left_pos != -1 else numpy.nan
-                    right_values[i] = other._data[right_pos] if right_pos != -1 else numpy.nan
+                    left_value = self._data[left_pos] if left_pos != -1 else numpy.nan
+                    right_value = other._data[right_pos] if right_pos != -1 else numpy.nan
+                    result_data[i] = left_value / right_value
 
-                result_data = left_values / right_values
                 return pandas.Series(result_data, joined_index)
 
             return _series_operator_truediv_common_impl
@@ -620,7 +656,7 @@ def sdc_pandas_series_operator_truediv(self, other):
     return None
 
 
-@sdc_overload(operator.floordiv)
+@sdc_overload(operator.floordiv, jit_options={'error_model': 'numpy'})
 def sdc_pandas_series_operator_floordiv(self, other):
     """
     Pandas Series operator :attr:`pandas.Series.floordiv` implementation
@@ -649,7 +685,7 @@ def sdc_pandas_series_operator_floordiv(self, other):
 
     _func_name = 'Operator floordiv().'
 
-    ty_checker = TypeChecker('Operator floordiv().')
+    ty_checker = TypeChecker(_func_name)
     self_is_series, other_is_series = isinstance(self, SeriesType), isinstance(other, SeriesType)
     if not (self_is_series or other_is_series):
         return None
@@ -684,41 +720,42 @@ def sdc_pandas_series_operator_floordiv(self, other):
     if not operands_are_series:
         def _series_operator_floordiv_scalar_impl(self, other):
             if self_is_series == True:  # noqa
+                scalar = numpy.float64(other)
                 result_data = numpy.empty(len(self._data), dtype=numpy.float64)
-                result_data[:] = self._data // numpy.float64(other)
+                for i in numba.prange(len(self._data)):
+                    result_data[i] = self._data[i] // scalar
                 return pandas.Series(result_data, index=self._index, name=self._name)
             else:
+                scalar = numpy.float64(self)
                 result_data = numpy.empty(len(other._data), dtype=numpy.float64)
-                result_data[:] = numpy.float64(self) // other._data
+                for i in numba.prange(len(other._data)):
+                    result_data[i] = scalar // other._data[i]
                 return pandas.Series(result_data, index=other._index, name=other._name)
 
         return _series_operator_floordiv_scalar_impl
 
     else:   # both operands are numeric series
 
+        # numpy already produces float64 result if any of operands is float64, so no conversion is needed
+        result_is_float64 = self.dtype == types.float64 or other.dtype == types.float64
+
         # optimization for series with default indexes, that can be aligned differently
         if (isinstance(self.index, types.NoneType) and isinstance(other.index, types.NoneType)):
             def _series_operator_floordiv_none_indexes_impl(self, other):
+                left_size, right_size = len(self._data), len(other._data)
+                if result_is_float64 == True:  # noqa
+                    if (left_size == right_size):
+                        return pandas.Series(self._data // other._data)
 
-                if (len(self._data) == len(other._data)):
-                    result_data = astype(self._data, numpy.float64)
-                    result_data = result_data // other._data
-                    return pandas.Series(result_data)
-                else:
-                    left_size, right_size = len(self._data), len(other._data)
-                    min_data_size = min(left_size, right_size)
-                    max_data_size = max(left_size, right_size)
-                    result_data = numpy.empty(max_data_size, dtype=numpy.float64)
-                    if (left_size == min_data_size):
-                        result_data[:min_data_size] = self._data
-                        result_data[min_data_size:] = numpy.nan
-                        result_data = result_data // other._data
-                    else:
-                        result_data[:min_data_size] = other._data
-                        result_data[min_data_size:] = numpy.nan
-                        result_data = self._data // result_data
+                # values are read as float64 (missing ones as NaN), so no conversion of operands is needed
+                max_data_size = max(left_size, right_size)
+                result_data = numpy.empty(max_data_size, dtype=numpy.float64)
+                for i in numba.prange(max_data_size):
+                    left_value = self._data[i] if i < left_size else numpy.nan
+                    right_value = other._data[i] if i < right_size else numpy.nan
+                    result_data[i] = left_value // right_value
 
-                    return pandas.Series(result_data)
+                return pandas.Series(result_data)
 
             return _series_operator_floordiv_none_indexes_impl
         else:
@@ -729,15 +766,24 @@ def sdc_pandas_series_operator_floordiv(self, other):
                 numba_index_common_dtype = find_common_dtype_from_numpy_dtypes(
                     [ty_left_index_dtype, ty_right_index_dtype], [])
 
+            # left index is used in result as-is if it already has common dtype
+            left_index_is_common = none_or_numeric_indexes and ty_left_index_dtype == numba_index_common_dtype
+
             def _series_operator_floordiv_common_impl(self, other):
                 left_index, right_index = self.index, other.index
 
                 # check if indexes are equal and series don't have to be aligned
                 if sdc_check_indexes_equal(left_index, right_index):
-                    result_data = numpy.empty(len(self._data), dtype=numpy.float64)
-                    result_data[:] = self._data // other._data
+                    if result_is_float64 == True:  # noqa
+                        result_data = self._data // other._data
+                    else:
+                        result_data = numpy.empty(len(self._data), dtype=numpy.float64)
+                        for i in numba.prange(len(self._data)):
+                            result_data[i] = self._data[i] // other._data[i]
 
-                    if none_or_numeric_indexes == True:  # noqa
+                    if left_index_is_common == True:  # noqa
+                        result_index = left_index
+                    elif none_or_numeric_indexes == True:  # noqa
                         result_index = astype(left_index, numba_index_common_dtype)
                     else:
                         result_index = self._index
@@ -748,14 +794,13 @@ def sdc_pandas_series_operator_floordiv(self, other):
                 joined_index, left_indexer, right_indexer = sdc_join_series_indexes(left_index, right_index)
 
                 result_size = len(joined_index)
-                left_values = numpy.empty(result_size, dtype=numpy.float64)
-                right_values = numpy.empty(result_size, dtype=numpy.float64)
+                result_data = numpy.empty(result_size, dtype=numpy.float64)
                 for i in numba.prange(result_size):
                     left_pos, right_pos = left_indexer[i], right_indexer[i]
-                    left_values[i] = self._data[left_pos] if left_pos != -1 else numpy.nan
-                    right_values[i] = other._data[right_pos] if right_pos != -1 else numpy.nan
+                    left_value = self._data[left_pos] if left_pos != -1 else numpy.nan
+                    right_value = other._data[right_pos] if right_pos != -1 else numpy.nan
+                    result_data[i] = left_value // right_value
 
-                result_data = left_values // right_values
                 return pandas.Series(result_data, joined_index)
 
             return _series_operator_floordiv_common_impl
@@ -763,7 +808,7 @@ def sdc_pandas_series_operator_floordiv(self, other):
     return None
 
 
-@sdc_overload(operator.mod)
+@sdc_overload(operator.mod, jit_options={'error_model': 'numpy'})
 def sdc_pandas_series_operator_mod(self, other):
     """
     Pandas Series operator :attr:`pandas.Series.mod` implementation
@@ -792,7 +837,7 @@ def sdc_pandas_series_operator_mod(self, other):
 
     _func_name = 'Operator mod().'
 
-    ty_checker = TypeChecker('Operator mod().')
+    ty_checker = TypeChecker(_func_name)
     self_is_series, other_is_series = isinstance(self, SeriesType), isinstance(other, SeriesType)
     if not (self_is_series or other_is_series):
         return None
@@ -827,41 +872,42 @@ def sdc_pandas_series_operator_mod(self, other):
     if not operands_are_series:
         def _series_operator_mod_scalar_impl(self, other):
             if self_is_series == True:  # noqa
+                scalar = numpy.float64(other)
                 result_data = numpy.empty(len(self._data), dtype=numpy.float64)
-                result_data[:] = self._data % numpy.float64(other)
+                for i in numba.prange(len(self._data)):
+                    result_data[i] = self._data[i] % scalar
                 return pandas.Series(result_data, index=self._index, name=self._name)
             else:
+                scalar = numpy.float64(self)
                 result_data = numpy.empty(len(other._data), dtype=numpy.float64)
-                result_data[:] = numpy.float64(self) % other._data
+                for i in numba.prange(len(other._data)):
+                    result_data[i] = scalar % other._data[i]
                 return pandas.Series(result_data, index=other._index, name=other._name)
 
         return _series_operator_mod_scalar_impl
 
     else:   # both operands are numeric series
 
+        # numpy already produces float64 result if any of operands is float64, so no conversion is needed
+        result_is_float64 = self.dtype == types.float64 or other.dtype == types.float64
+
         # optimization for series with default indexes, that can be aligned differently
         if (isinstance(self.index, types.NoneType) and isinstance(other.index, types.NoneType)):
             def _series_operator_mod_none_indexes_impl(self, other):
+                left_size, right_size = len(self._data), len(other._data)
+                if result_is_float64 == True:  # noqa
+                    if (left_size == right_size):
+                        return pandas.Series(self._data % other._data)
 
-                if (len(self._data) == len(other._data)):
-                    result_data = astype(self._data, numpy.float64)
-                    result_data = result_data % other._data
-                    return pandas.Series(result_data)
-                else:
-                    left_size, right_size = len(self._data), len(other._data)
-                    min_data_size = min(left_size, right_size)
-                    max_data_size = max(left_size, right_size)
-                    result_data = numpy.empty(max_data_size, dtype=numpy.float64)
-                    if (left_size == min_data_size):
-                        result_data[:min_data_size] = self._data
-                        result_data[min_data_size:] = numpy.nan
-                        result_data = result_data % other._data
-                    else:
-                        result_data[:min_data_size] = other._data
-                        result_data[min_data_size:] = numpy.nan
-                        result_data = self._data % result_data
+                # values are read as float64 (missing ones as NaN), so no conversion of operands is needed
+                max_data_size = max(left_size, right_size)
+                result_data = numpy.empty(max_data_size, dtype=numpy.float64)
+                for i in numba.prange(max_data_size):
+                    left_value = self._data[i] if i < left_size else numpy.nan
+                    right_value = other._data[i] if i < right_size else numpy.nan
+                    result_data[i] = left_value % right_value
 
-                    return pandas.Series(result_data)
+                return pandas.Series(result_data)
 
             return _series_operator_mod_none_indexes_impl
         else:
@@ -872,15 +918,24 @@ def sdc_pandas_series_operator_mod(self, other):
                 numba_index_common_dtype = find_common_dtype_from_numpy_dtypes(
                     [ty_left_index_dtype, ty_right_index_dtype], [])
 
+            # left index is used in result as-is if it already has common dtype
+            left_index_is_common = none_or_numeric_indexes and ty_left_index_dtype == numba_index_common_dtype
+
             def _series_operator_mod_common_impl(self, other):
                 left_index, right_index = self.index, other.index
 
                 # check if indexes are equal and series don't have to be aligned
                 if sdc_check_indexes_equal(left_index, right_index):
-                    result_data = numpy.empty(len(self._data), dtype=numpy.float64)
-                    result_data[:] = self._data % other._data
+                    if result_is_float64 == True:  # noqa
+                        result_data = self._data % other._data
+                    else:
+                        result_data = numpy.empty(len(self._data), dtype=numpy.float64)
+                        for i in numba.prange(len(self._data)):
+                            result_data[i] = self._data[i] % other._data[i]
 
-                    if none_or_numeric_indexes == True:  # noqa
+                    if left_index_is_common == True:  # noqa
+                        result_index = left_index
+                    elif none_or_numeric_indexes == True:  # noqa
                         result_index = astype(left_index, numba_index_common_dtype)
                     else:
                         result_index = self._index
@@ -891,14 +946,13 @@ def sdc_pandas_series_operator_mod(self, other):
                 joined_index, left_indexer, right_indexer = sdc_join_series_indexes(left_index, right_index)
 
                 result_size = len(joined_index)
-                left_values = numpy.empty(result_size, dtype=numpy.float64)
-                right_values = numpy.empty(result_size, dtype=numpy.float64)
+                result_data = numpy.empty(result_size, dtype=numpy.float64)
                 for i in numba.prange(result_size):
                     left_pos, right_pos = left_indexer[i], right_indexer[i]
-                    left_values[i] = self._data[left_pos] if left_pos != -1 else numpy.nan
-                    right_values[i] = other._data[right_pos] if right_pos != -1 else numpy.nan
+                    left_value = self._data[left_pos] if left_pos != -1 else numpy.nan
+                    right_value = other._data[right_pos] if right_pos != -1 else numpy.nan
+                    result_data[i] = left_value % right_value
 
-                result_data = left_values % right_values
                 return pandas.Series(result_data, joined_index)
 
             return _series_operator_mod_common_impl
@@ -906,7 +960,7 @@ def sdc_pandas_series_operator_mod(self, other):
     return None
 
 
-@sdc_overload(operator.pow)
+@sdc_overload(operator.pow, jit_options={'error_model': 'numpy'})
 def sdc_pandas_series_operator_pow(self, other):
     """
     Pandas Series operator :attr:`pandas.Series.pow` implementation
@@ -935,7 +989,7 @@ def sdc_pandas_series_operator_pow(self, other):
 
     _func_name = 'Operator pow().'
 
-    ty_checker = TypeChecker('Operator pow().')
+    ty_checker = TypeChecker(_func_name)
     self_is_series, other_is_series = isinstance(self, SeriesType), isinstance(other, SeriesType)
     if not (self_is_series or other_is_series):
         return None
@@ -970,41 +1024,42 @@ def sdc_pandas_series_operator_pow(self, other):
     if not operands_are_series:
         def _series_operator_pow_scalar_impl(self, other):
             if self_is_series == True:  # noqa
+                scalar = numpy.float64(other)
                 result_data = numpy.empty(len(self._data), dtype=numpy.float64)
-                result_data[:] = self._data ** numpy.float64(other)
+                for i in numba.prange(len(self._data)):
+                    result_data[i] = self._data[i] ** scalar
                 return pandas.Series(result_data, index=self._index, name=self._name)
             else:
+                scalar = numpy.float64(self)
                 result_data = numpy.empty(len(other._data), dtype=numpy.float64)
-                result_data[:] = numpy.float64(self) ** other._data
+                for i in numba.prange(len(other._data)):
+                    result_data[i] = scalar ** other._data[i]
                 return pandas.Series(result_data, index=other._index, name=other._name)
 
         return _series_operator_pow_scalar_impl
 
     else:   # both operands are numeric series
 
+        # numpy already produces float64 result if any of operands is float64, so no conversion is needed
+        result_is_float64 = self.dtype == types.float64 or other.dtype == types.float64
+
         # optimization for series with default indexes, that can be aligned differently
         if (isinstance(self.index, types.NoneType) and isinstance(other.index, types.NoneType)):
             def _series_operator_pow_none_indexes_impl(self, other):
+                left_size, right_size = len(self._data), len(other._data)
+                if result_is_float64 == True:  # noqa
+                    if (left_size == right_size):
+                        return pandas.Series(self._data ** other._data)
 
-                if (len(self._data) == len(other._data)):
-                    result_data = astype(self._data, numpy.float64)
-                    result_data = result_data ** other._data
-                    return pandas.Series(result_data)
-                else:
-                    left_size, right_size = len(self._data), len(other._data)
-                    min_data_size = min(left_size, right_size)
-                    max_data_size = max(left_size, right_size)
-                    result_data = numpy.empty(max_data_size, dtype=numpy.float64)
-                    if (left_size == min_data_size):
-                        result_data[:min_data_size] = self._data
-                        result_data[min_data_size:] = numpy.nan
-                        result_data = result_data ** other._data
-                    else:
-                        result_data[:min_data_size] = other._data
-                        result_data[min_data_size:] = numpy.nan
-                        result_data = self._data ** result_data
+                # values are read as float64 (missing ones as NaN), so no conversion of operands is needed
+                max_data_size = max(left_size, right_size)
+                result_data = numpy.empty(max_data_size, dtype=numpy.float64)
+                for i in numba.prange(max_data_size):
+                    left_value = self._data[i] if i < left_size else numpy.nan
+                    right_value = other._data[i] if i < right_size else numpy.nan
+                    result_data[i] = left_value ** right_value
 
-                    return pandas.Series(result_data)
+                return pandas.Series(result_data)
 
             return _series_operator_pow_none_indexes_impl
         else:
@@ -1015,15 +1070,24 @@ def sdc_pandas_series_operator_pow(self, other):
                 numba_index_common_dtype = find_common_dtype_from_numpy_dtypes(
                     [ty_left_index_dtype, ty_right_index_dtype], [])
 
+            # left index is used in result as-is if it already has common dtype
+            left_index_is_common = none_or_numeric_indexes and ty_left_index_dtype == numba_index_common_dtype
+
             def _series_operator_pow_common_impl(self, other):
                 left_index, right_index = self.index, other.index
 
                 # check if indexes are equal and series don't have to be aligned
                 if sdc_check_indexes_equal(left_index, right_index):
-                    result_data = numpy.empty(len(self._data), dtype=numpy.float64)
-                    result_data[:] = self._data ** other._data
+                    if result_is_float64 == True:  # noqa
+                        result_data = self._data ** other._data
+                    else:
+                        result_data = numpy.empty(len(self._data), dtype=numpy.float64)
+                        for i in numba.prange(len(self._data)):
+                            result_data[i] = self._data[i] ** other._data[i]
 
-                    if none_or_numeric_indexes == True:  # noqa
+                    if left_index_is_common == True:  # noqa
+                        result_index = left_index
+                    elif none_or_numeric_indexes == True:  # noqa
                         result_index = astype(left_index, numba_index_common_dtype)
                     else:
                         result_index = self._index
@@ -1034,14 +1098,13 @@ def sdc_pandas_series_operator_pow(self, other):
                 joined_index, left_indexer, right_indexer = sdc_join_series_indexes(left_index, right_index)
 
                 result_size = len(joined_index)
-                left_values = numpy.empty(result_size, dtype=numpy.float64)
-                right_values = numpy.empty(result_size, dtype=numpy.float64)
+                result_data = numpy.empty(result_size, dtype=numpy.float64)
                 for i in numba.prange(result_size):
                     left_pos, right_pos = left_indexer[i], right_indexer[i]
-                    left_values[i] = self._data[left_pos] if left_pos != -1 else numpy.nan
-                    right_values[i] = other._data[right_pos] if right_pos != -1 else numpy.nan
+                    left_value = self._data[left_pos] if left_pos != -1 else numpy.nan
+                    right_value = other._data[right_pos] if right_pos != -1 else numpy.nan
+                    result_data[i] = left_value ** right_value
 
-                result_data = left_values ** right_values
                 return pandas.Series(result_data, joined_index)
 
             return _series_operator_pow_common_impl
@@ -1074,7 +1137,7 @@ def sdc_pandas_series_operator_lt(self, other):
 
     _func_name = 'Operator lt().'
 
-    ty_checker = TypeChecker('Operator lt().')
+    ty_checker = TypeChecker(_func_name)
     self_is_series, other_is_series = isinstance(self, SeriesType), isinstance(other, SeriesType)
     if not (self_is_series or other_is_series):
         return None
@@ -1128,11 +1191,16 @@ def sdc_pandas_series_operator_lt(self, other):
                 numba_index_common_dtype = find_common_dtype_from_numpy_dtypes(
                     [ty_left_index_dtype, ty_right_index_dtype], [])
 
+            # left index is used in result as-is if it already has common dtype
+            left_index_is_common = none_or_numeric_indexes and ty_left_index_dtype == numba_index_common_dtype
+
             def _series_operator_lt_common_impl(self, other):
                 left_index, right_index = self.index, other.index
 
                 if sdc_check_indexes_equal(left_index, right_index):
-                    if none_or_numeric_indexes == True:  # noqa
+                    if left_index_is_common == True:  # noqa
+                        new_index = left_index
+                    elif none_or_numeric_indexes == True:  # noqa
                         new_index = astype(left_index, numba_index_common_dtype)
                     else:
                         new_index = self._index
@@ -1171,7 +1239,7 @@ def sdc_pandas_series_operator_gt(self, other):
 
     _func_name = 'Operator gt().'
 
-    ty_checker = TypeChecker('Operator gt().')
+    ty_checker = TypeChecker(_func_name)
     self_is_series, other_is_series = isinstance(self, SeriesType), isinstance(other, SeriesType)
     if not (self_is_series or other_is_series):
         return None
@@ -1225,11 +1293,16 @@ def sdc_pandas_series_operator_gt(self, other):
                 numba_index_common_dtype = find_common_dtype_from_numpy_dtypes(
                     [ty_left_index_dtype, ty_right_index_dtype], [])
 
+            # left index is used in result as-is if it already has common dtype
+            left_index_is_common = none_or_numeric_indexes and ty_left_index_dtype == numba_index_common_dtype
+
             def _series_operator_gt_common_impl(self, other):
                 left_index, right_index = self.index, other.index
 
                 if sdc_check_indexes_equal(left_index, right_index):
-                    if none_or_numeric_indexes == True:  # noqa
+                    if left_index_is_common == True:  # noqa
+                        new_index = left_index
+                    elif none_or_numeric_indexes == True:  # noqa
                         new_index = astype(left_index, numba_index_common_dtype)
                     else:
                         new_index = self._index
@@ -1268,7 +1341,7 @@ def sdc_pandas_series_operator_le(self, other):
 
     _func_name = 'Operator le().'
 
-    ty_checker = TypeChecker('Operator le().')
+    ty_checker = TypeChecker(_func_name)
     self_is_series, other_is_series = isinstance(self, SeriesType), isinstance(other, SeriesType)
     if not (self_is_series or other_is_series):
         return None
@@ -1322,11 +1395,16 @@ def sdc_pandas_series_operator_le(self, other):
                 numba_index_common_dtype = find_common_dtype_from_numpy_dtypes(
                     [ty_left_index_dtype, ty_right_index_dtype], [])
 
+            # left index is used in result as-is if it already has common dtype
+            left_index_is_common = none_or_numeric_indexes and ty_left_index_dtype == numba_index_common_dtype
+
             def _series_operator_le_common_impl(self, other):
                 left_index, right_index = self.index, other.index
 
                 if sdc_check_indexes_equal(left_index, right_index):
-                    if none_or_numeric_indexes == True:  # noqa
+                    if left_index_is_common == True:  # noqa
+                        new_index = left_index
+                    elif none_or_numeric_indexes == True:  # noqa
                         new_index = astype(left_index, numba_index_common_dtype)
                     else:
                         new_index = self._index
@@ -1365,7 +1443,7 @@ def sdc_pandas_series_operator_ge(self, other):
 
     _func_name = 'Operator ge().'
 
-    ty_checker = TypeChecker('Operator ge().')
+    ty_checker = TypeChecker(_func_name)
     self_is_series, other_is_series = isinstance(self, SeriesType), isinstance(other, SeriesType)
     if not (self_is_series or other_is_series):
         return None
@@ -1419,11 +1497,16 @@ def sdc_pandas_series_operator_ge(self, other):
                 numba_index_common_dtype = find_common_dtype_from_numpy_dtypes(
                     [ty_left_index_dtype, ty_right_index_dtype], [])
 
+            # left index is used in result as-is if it already has common dtype
+            left_index_is_common = none_or_numeric_indexes and ty_left_index_dtype == numba_index_common_dtype
+
             def _series_operator_ge_common_impl(self, other):
                 left_index, right_index = self.index, other.index
 
                 if sdc_check_indexes_equal(left_index, right_index):
-                    if none_or_numeric_indexes == True:  # noqa
+                    if left_index_is_common == True:  # noqa
+                        new_index = left_index
+                    elif none_or_numeric_indexes == True:  # noqa
                         new_index = astype(left_index, numba_index_common_dtype)
                     else:
                         new_index = self._index
@@ -1462,7 +1545,7 @@ def sdc_pandas_series_operator_ne(self, other):
 
     _func_name = 'Operator ne().'
 
-    ty_checker = TypeChecker('Operator ne().')
+    ty_checker = TypeChecker(_func_name)
     self_is_series, other_is_series = isinstance(self, SeriesType), isinstance(other, SeriesType)
     if not (self_is_series or other_is_series):
         return None
@@ -1516,11 +1599,16 @@ def sdc_pandas_series_operator_ne(self, other):
                 numba_index_common_dtype = find_common_dtype_from_numpy_dtypes(
                     [ty_left_index_dtype, ty_right_index_dtype], [])
 
+            # left index is used in result as-is if it already has common dtype
+            left_index_is_common = none_or_numeric_indexes and ty_left_index_dtype == numba_index_common_dtype
+
             def _series_operator_ne_common_impl(self, other):
                 left_index, right_index = self.index, other.index
 
                 if sdc_check_indexes_equal(left_index, right_index):
-                    if none_or_numeric_indexes == True:  # noqa
+                    if left_index_is_common == True:  # noqa
+                        new_index = left_index
+                    elif none_or_numeric_indexes == True:  # noqa
                         new_index = astype(left_index, numba_index_common_dtype)
                     else:
                         new_index = self._index
@@ -1559,7 +1647,7 @@ def sdc_pandas_series_operator_eq(self, other):
 
     _func_name = 'Operator eq().'
 
-    ty_checker = TypeChecker('Operator eq().')
+    ty_checker = TypeChecker(_func_name)
     self_is_series, other_is_series = isinstance(self, SeriesType), isinstance(other, SeriesType)
     if not (self_is_series or other_is_series):
         return None
@@ -1613,11 +1701,16 @@ def sdc_pandas_series_operator_eq(self, other):
                 numba_index_common_dtype = find_common_dtype_from_numpy_dtypes(
                     [ty_left_index_dtype, ty_right_index_dtype], [])
 
+            # left index is used in result as-is if it already has common dtype
+            left_index_is_common = none_or_numeric_indexes and ty_left_index_dtype == numba_index_common_dtype
+
             def _series_operator_eq_common_impl(self, other):
                 left_index, right_index = self.index, other.index
 
                 if sdc_check_indexes_equal(left_index, right_index):
-                    if none_or_numeric_indexes == True:  # noqa
+                    if left_index_is_common == True:  # noqa
+                        new_index = left_index
+                    elif none_or_numeric_indexes == True:  # noqa
                         new_index = astype(left_index, numba_index_common_dtype)
                     else:
                         new_index = self._index
@@ -1648,27 +1741,27 @@ def sdc_str_arr_operator_lt(self, other):
             if len(self) != len(other):
                 raise ValueError("Mismatch of String Arrays sizes in operator.lt")
             n = len(self)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self[i] < other[i]
-                               and not (str_arr_is_na(self, i) or str_arr_is_na(other, i)))
-            return out_list
+                is_na = str_arr_is_na(self, i) or str_arr_is_na(other, i)
+                result[i] = not is_na and str_arr_items_compare(self, i, other, i) < 0
+            return result
 
     elif self_is_str_arr:
         def _sdc_str_arr_operator_lt_impl(self, other):
             n = len(self)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self[i] < other and not (str_arr_is_na(self, i)))
-            return out_list
+                result[i] = not str_arr_is_na(self, i) and self[i] < other
+            return result
 
     elif other_is_str_arr:
         def _sdc_str_arr_operator_lt_impl(self, other):
             n = len(other)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self < other[i] and not (str_arr_is_na(other, i)))
-            return out_list
+                result[i] = not str_arr_is_na(other, i) and self < other[i]
+            return result
     else:
         return None
 
@@ -1692,27 +1785,27 @@ def sdc_str_arr_operator_gt(self, other):
             if len(self) != len(other):
                 raise ValueError("Mismatch of String Arrays sizes in operator.gt")
             n = len(self)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self[i] > other[i]
-                               and not (str_arr_is_na(self, i) or str_arr_is_na(other, i)))
-            return out_list
+                is_na = str_arr_is_na(self, i) or str_arr_is_na(other, i)
+                result[i] = not is_na and str_arr_items_compare(self, i, other, i) > 0
+            return result
 
     elif self_is_str_arr:
         def _sdc_str_arr_operator_gt_impl(self, other):
             n = len(self)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self[i] > other and not (str_arr_is_na(self, i)))
-            return out_list
+                result[i] = not str_arr_is_na(self, i) and self[i] > other
+            return result
 
     elif other_is_str_arr:
         def _sdc_str_arr_operator_gt_impl(self, other):
             n = len(other)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self > other[i] and not (str_arr_is_na(other, i)))
-            return out_list
+                result[i] = not str_arr_is_na(other, i) and self > other[i]
+            return result
     else:
         return None
 
@@ -1736,27 +1829,27 @@ def sdc_str_arr_operator_le(self, other):
             if len(self) != len(other):
                 raise ValueError("Mismatch of String Arrays sizes in operator.le")
             n = len(self)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self[i] <= other[i]
-                               and not (str_arr_is_na(self, i) or str_arr_is_na(other, i)))
-            return out_list
+                is_na = str_arr_is_na(self, i) or str_arr_is_na(other, i)
+                result[i] = not is_na and str_arr_items_compare(self, i, other, i) <= 0
+            return result
 
     elif self_is_str_arr:
         def _sdc_str_arr_operator_le_impl(self, other):
             n = len(self)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self[i] <= other and not (str_arr_is_na(self, i)))
-            return out_list
+                result[i] = not str_arr_is_na(self, i) and self[i] <= other
+            return result
 
     elif other_is_str_arr:
         def _sdc_str_arr_operator_le_impl(self, other):
             n = len(other)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self <= other[i] and not (str_arr_is_na(other, i)))
-            return out_list
+                result[i] = not str_arr_is_na(other, i) and self <= other[i]
+            return result
     else:
         return None
 
@@ -1780,27 +1873,27 @@ def sdc_str_arr_operator_ge(self, other):
             if len(self) != len(other):
                 raise ValueError("Mismatch of String Arrays sizes in operator.ge")
             n = len(self)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self[i] >= other[i]
-                               and not (str_arr_is_na(self, i) or str_arr_is_na(other, i)))
-            return out_list
+                is_na = str_arr_is_na(self, i) or str_arr_is_na(other, i)
+                result[i] = not is_na and str_arr_items_compare(self, i, other, i) >= 0
+            return result
 
     elif self_is_str_arr:
         def _sdc_str_arr_operator_ge_impl(self, other):
             n = len(self)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self[i] >= other and not (str_arr_is_na(self, i)))
-            return out_list
+                result[i] = not str_arr_is_na(self, i) and self[i] >= other
+            return result
 
     elif other_is_str_arr:
         def _sdc_str_arr_operator_ge_impl(self, other):
             n = len(other)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self >= other[i] and not (str_arr_is_na(other, i)))
-            return out_list
+                result[i] = not str_arr_is_na(other, i) and self >= other[i]
+            return result
     else:
         return None
 
@@ -1824,27 +1917,27 @@ def sdc_str_arr_operator_ne(self, other):
             if len(self) != len(other):
                 raise ValueError("Mismatch of String Arrays sizes in operator.ne")
             n = len(self)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self[i] != other[i]
-                               or (str_arr_is_na(self, i) or str_arr_is_na(other, i)))
-            return out_list
+                is_na = str_arr_is_na(self, i) or str_arr_is_na(other, i)
+                result[i] = is_na or not str_arr_items_equal(self, i, other, i)
+            return result
 
     elif self_is_str_arr:
         def _sdc_str_arr_operator_ne_impl(self, other):
             n = len(self)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self[i] != other or (str_arr_is_na(self, i)))
-            return out_list
+                result[i] = str_arr_is_na(self, i) or self[i] != other
+            return result
 
     elif other_is_str_arr:
         def _sdc_str_arr_operator_ne_impl(self, other):
             n = len(other)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self != other[i] or (str_arr_is_na(other, i)))
-            return out_list
+                result[i] = str_arr_is_na(other, i) or self != other[i]
+            return result
     else:
         return None
 
@@ -1868,27 +1961,27 @@ def sdc_str_arr_operator_eq(self, other):
             if len(self) != len(other):
                 raise ValueError("Mismatch of String Arrays sizes in operator.eq")
             n = len(self)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self[i] == other[i]
-                               and not (str_arr_is_na(self, i) or str_arr_is_na(other, i)))
-            return out_list
+                is_na = str_arr_is_na(self, i) or str_arr_is_na(other, i)
+                result[i] = not is_na and str_arr_items_equal(self, i, other, i)
+            return result
 
     elif self_is_str_arr:
         def _sdc_str_arr_operator_eq_impl(self, other):
             n = len(self)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self[i] == other and not (str_arr_is_na(self, i)))
-            return out_list
+                result[i] = not str_arr_is_na(self, i) and self[i] == other
+            return result
 
     elif other_is_str_arr:
         def _sdc_str_arr_operator_eq_impl(self, other):
             n = len(other)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self == other[i] and not (str_arr_is_na(other, i)))
-            return out_list
+                result[i] = not str_arr_is_na(other, i) and self == other[i]
+            return result
     else:
         return None
 
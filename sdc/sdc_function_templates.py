@@ -44,7 +44,7 @@ from sdc.utilities.sdc_typing_utils import (TypeChecker, check_index_is_numeric,
                                             find_common_dtype_from_numpy_dtypes)
 from sdc.datatypes.common_functions import (sdc_join_series_indexes, sdc_check_indexes_equal)
 from sdc.hiframes.pd_series_type import SeriesType
-from sdc.str_arr_ext import (string_array_type, str_arr_is_na)
+from sdc.str_arr_ext import (string_array_type, str_arr_is_na, str_arr_items_equal, str_arr_items_compare)
 from sdc.utilities.utils import sdc_overload
 from sdc.functions.numpy_like import astype
 
@@ -77,7 +77,7 @@ def sdc_pandas_series_operator_binop(self, other):
 
     _func_name = 'Operator binop().'
 
-    ty_checker = TypeChecker('Operator binop().')
+    ty_checker = TypeChecker(_func_name)
     self_is_series, other_is_series = isinstance(self, SeriesType), isinstance(other, SeriesType)
     if not (self_is_series or other_is_series):
         return None
@@ -112,41 +112,42 @@ def sdc_pandas_series_operator_binop(self, other):
     if not operands_are_series:
         def _series_operator_binop_scalar_impl(self, other):
             if self_is_series == True:  # noqa
+                scalar = numpy.float64(other)
                 result_data = numpy.empty(len(self._data), dtype=numpy.float64)
-                result_data[:] = self._data + numpy.float64(other)
+                for i in numba.prange(len(self._data)):
+                    result_data[i] = self._data[i] + scalar
                 return pandas.Series(result_data, index=self._index, name=self._name)
             else:
+                scalar = numpy.float64(self)
                 result_data = numpy.empty(len(other._data), dtype=numpy.float64)
-                result_data[:] = numpy.float64(self) + other._data
+                for i in numba.prange(len(other._data)):
+                    result_data[i] = scalar + other._data[i]
                 return pandas.Series(result_data, index=other._index, name=other._name)
 
         return _series_operator_binop_scalar_impl
 
     else:   # both operands are numeric series
 
+        # numpy already produces float64 result if any of operands is float64, so no conversion is needed
+        result_is_float64 = self.dtype == types.float64 or other.dtype == types.float64
+
         # optimization for series with default indexes, that can be aligned differently
         if (isinstance(self.index, types.NoneType) and isinstance(other.index, types.NoneType)):
             def _series_operator_binop_none_indexes_impl(self, other):
+                left_size, right_size = len(self._data), len(other._data)
+                if result_is_float64 == True:  # noqa
+                    if (left_size == right_size):
+                        return pandas.Series(self._data + other._data)
 
-                if (len(self._data) == len(other._data)):
-                    result_data = astype(self._data, numpy.float64)
-                    result_data = result_data + other._data
-                    return pandas.Series(result_data)
-                else:
-                    left_size, right_size = len(self._data), len(other._data)
-                    min_data_size = min(left_size, right_size)
-                    max_data_size = max(left_size, right_size)
-                    result_data = numpy.empty(max_data_size, dtype=numpy.float64)
-                    if (left_size == min_data_size):
-                        result_data[:min_data_size] = self._data
-                        result_data[min_data_size:] = numpy.nan
-                        result_data = result_data + other._data
-                    else:
-                        result_data[:min_data_size] = other._data
-                        result_data[min_data_size:] = numpy.nan
-                        result_data = self._data + result_data
+                # values are read as float64 (missing ones as NaN), so no conversion of operands is needed
+                max_data_size = max(left_size, right_size)
+                result_data = numpy.empty(max_data_size, dtype=numpy.float64)
+                for i in numba.prange(max_data_size):
+                    left_value = self._data[i] if i < left_size else numpy.nan
+                    right_value = other._data[i] if i < right_size else numpy.nan
+                    result_data[i] = left_value + right_value
 
-                    return pandas.Series(result_data)
+                return pandas.Series(result_data)
 
             return _series_operator_binop_none_indexes_impl
         else:
@@ -157,15 +158,24 @@ def sdc_pandas_series_operator_binop(self, other):
                 numba_index_common_dtype = find_common_dtype_from_numpy_dtypes(
                     [ty_left_index_dtype, ty_right_index_dtype], [])
 
+            # left index is used in result as-is if it already has common dtype
+            left_index_is_common = none_or_numeric_indexes and ty_left_index_dtype == numba_index_common_dtype
+
             def _series_operator_binop_common_impl(self, other):
                 left_index, right_index = self.index, other.index
 
                 # check if indexes are equal and series don't have to be aligned
                 if sdc_check_indexes_equal(left_index, right_index):
-                    result_data = numpy.empty(len(self._data), dtype=numpy.float64)
-                    result_data[:] = self._data + other._data
+                    if result_is_float64 == True:  # noqa
+                        result_data = self._data + other._data
+                    else:
+                        result_data = numpy.empty(len(self._data), dtype=numpy.float64)
+                        for i in numba.prange(len(self._data)):
+                            result_data[i] = self._data[i] + other._data[i]
 
-                    if none_or_numeric_indexes == True:  # noqa
+                    if left_index_is_common == True:  # noqa
+                        result_index = left_index
+                    elif none_or_numeric_indexes == True:  # noqa
                         result_index = astype(left_index, numba_index_common_dtype)
                     else:
                         result_index = self._index
@@ -176,14 +186,13 @@ def sdc_pandas_series_operator_binop(self, other):
                 joined_index, left_indexer, right_indexer = sdc_join_series_indexes(left_index, right_index)
 
                 result_size = len(joined_index)
-                left_values = numpy.empty(result_size, dtype=numpy.float64)
-                right_values = numpy.empty(result_size, dtype=numpy.float64)
+                result_data = numpy.empty(result_size, dtype=numpy.float64)
                 for i in numba.prange(result_size):
                     left_pos, right_pos = left_indexer[i], right_indexer[i]
-                    left_values[i] = self._data[left_pos] if left_pos != -1 else numpy.nan
-                    right_values[i] = other._data[right_pos] if right_pos != -1 else numpy.nan
+                    left_value = self._data[left_pos] if left_pos != -1 else numpy.nan
+                    right_value = other._data[right_pos] if right_pos != -1 else numpy.nan
+                    result_data[i] = left_value + right_value
 
-                result_data = left_values + right_values
                 return pandas.Series(result_data, joined_index)
 
             return _series_operator_binop_common_impl
@@ -215,7 +224,7 @@ def sdc_pandas_series_operator_comp_binop(self, other):
 
     _func_name = 'Operator comp_binop().'
 
-    ty_checker = TypeChecker('Operator comp_binop().')
+    ty_checker = TypeChecker(_func_name)
     self_is_series, other_is_series = isinstance(self, SeriesType), isinstance(other, SeriesType)
     if not (self_is_series or other_is_series):
         return None
@@ -269,11 +278,16 @@ def sdc_pandas_series_operator_comp_binop(self, other):
                 numba_index_common_dtype = find_common_dtype_from_numpy_dtypes(
                     [ty_left_index_dtype, ty_right_index_dtype], [])
 
+            # left index is used in result as-is if it already has common dtype
+            left_index_is_common = none_or_numeric_indexes and ty_left_index_dtype == numba_index_common_dtype
+
             def _series_operator_comp_binop_common_impl(self, other):
                 left_index, right_index = self.index, other.index
 
                 if sdc_check_indexes_equal(left_index, right_index):
-                    if none_or_numeric_indexes == True:  # noqa
+                    if left_index_is_common == True:  # noqa
+                        new_index = left_index
+                    elif none_or_numeric_indexes == True:  # noqa
                         new_index = astype(left_index, numba_index_common_dtype)
                     else:
                         new_index = self._index
@@ -303,27 +317,27 @@ def sdc_str_arr_operator_comp_binop(self, other):
             if len(self) != len(other):
                 raise ValueError("Mismatch of String Arrays sizes in operator.comp_binop")
             n = len(self)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self[i] < other[i]
-                               and not (str_arr_is_na(self, i) or str_arr_is_na(other, i)))
-            return out_list
+                is_na = str_arr_is_na(self, i) or str_arr_is_na(other, i)
+                result[i] = not is_na and str_arr_items_compare(self, i, other, i) < 0
+            return result
 
     elif self_is_str_arr:
         def _sdc_str_arr_operator_comp_binop_impl(self, other):
             n = len(self)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self[i] < other and not (str_arr_is_na(self, i)))
-            return out_list
+                result[i] = not str_arr_is_na(self, i) and self[i] < other
+            return result
 
     elif other_is_str_arr:
         def _sdc_str_arr_operator_comp_binop_impl(self, other):
             n = len(other)
-            out_list = [False] * n
+            result = numpy.empty(n, dtype=numpy.bool_)
             for i in numba.prange(n):
-                out_list[i] = (self < other[i] and not (str_arr_is_na(other, i)))
-            return out_list
+                result[i] = not str_arr_is_na(other, i) and self < other[i]
+            return result
     else:
         return None
 
@@ -909,6 +909,59 @@ def str_arr_is_na(typingctx, str_arr_typ, ind_typ=None):
     return types.bool_(string_array_type, types.intp), codegen
 
 
+@numba.njit(no_cpython_wrapper=True)
+def str_arr_items_equal(left_arr, left_ind, right_arr, right_ind):
+    """Check string array elements are equal by comparing their utf-8 bytes, i.e. without decoding"""
+    left_start = getitem_str_offset(left_arr, left_ind)
+    right_start = getitem_str_offset(right_arr, right_ind)
+    size = getitem_str_offset(left_arr, left_ind + 1) - left_start
+    if size != getitem_str_offset(right_arr, right_ind + 1) - right_start:
+        return False
+
+    return _str_arr_data_compare(left_arr, left_start, right_arr, right_start, size) == 0
+
+
+@numba.njit(no_cpython_wrapper=True)
+def str_arr_items_compare(left_arr, left_ind, right_arr, right_ind):
+    """
+    Compare string array elements lexicographically by their utf-8 bytes, i.e. without decoding
+    (byte order of utf-8 encoded strings is the same as order of their code points).
+    Returns negative, zero or positive value if left element is less, equal or greater than the right one.
+    """
+    left_start = getitem_str_offset(left_arr, left_ind)
+    right_start = getitem_str_offset(right_arr, right_ind)
+    left_size = getitem_str_offset(left_arr, left_ind + 1) - left_start
+    right_size = getitem_str_offset(right_arr, right_ind + 1) - right_start
+
+    res = _str_arr_data_compare(left_arr, left_start, right_arr, right_start, min(left_size, right_size))
+    if res == 0:
+        if left_size < right_size:
+            return -1
+        if left_size > right_size:
+            return 1
+
+    return res
+
+
+@intrinsic
+def _str_arr_data_compare(typingctx, left_arr_typ, left_offset_typ, right_arr_typ, right_offset_typ, size_typ=None):
+    def codegen(context, builder, sig, args):
+        left_arr, left_offset, right_arr, right_offset, size = args
+        left_string_array = context.make_helper(builder, string_array_type, left_arr)
+        right_string_array = context.make_helper(builder, string_array_type, right_arr)
+
+        fnty = lir.FunctionType(lir.IntType(32),
+                                [lir.IntType(8).as_pointer(),
+                                 lir.IntType(8).as_pointer(),
+                                 lir.IntType(64)])
+        fn_memcmp = builder.module.get_or_insert_function(fnty, name="memcmp")
+        return builder.call(fn_memcmp, [builder.gep(left_string_array.data, [left_offset]),
+                                        builder.gep(right_string_array.data, [right_offset]),
+                                        size])
+
+    return types.int32(string_array_type, types.intp, string_array_type, types.intp, types.intp), codegen
+
+
 @intrinsic
 def str_arr_set_na(typingctx, str_arr_typ, ind_typ=None):
     # None default to make IntelliSense happy
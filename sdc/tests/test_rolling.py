@@ -25,6 +25,7 @@
 # *****************************************************************************
 
 import itertools
+import math
 import os
 import platform
 import string
@@ -60,6 +61,45 @@ def rolling_var_usecase(obj, window, min_periods, ddof):
     return obj.rolling(window, min_periods).var(ddof)
 
 
+def rolling_max_usecase(obj, window, min_periods):
+    return obj.rolling(window, min_periods).max()
+
+
+def rolling_median_usecase(obj, window, min_periods):
+    return obj.rolling(window, min_periods).median()
+
+
+def rolling_min_usecase(obj, window, min_periods):
+    return obj.rolling(window, min_periods).min()
+
+
+def rolling_quantile_usecase(obj, window, min_periods, quantile):
+    return obj.rolling(window, min_periods).quantile(quantile)
+
+
+def gen_series_with_gaps(length=300):
+    """Generate series with monotonic runs and runs of NaN and infinite values"""
+    np.random.seed(0)
+    data = np.random.normal(0, 1, length)
+    data[30:45] = np.nan
+    data[60:100] = np.linspace(-3, 3, 40)
+    data[100:110] = np.inf
+    data[110:115] = np.NINF
+    data[115:150] = np.linspace(3, -3, 35)
+    data[170:250] = np.nan
+    data[260:290:3] = np.nan
+
+    return pd.Series(data)
+
+
+def gen_series_large_magnitude_spread(length=3000):
+    """Generate series where small values are mixed with big values cancelling each other"""
+    data = np.tile([1e16, 1., -1e16, 1.], length // 4)
+    data[1::4] = np.arange(length // 4) % 7 + 1.
+
+    return pd.Series(data)
+
+
 class TestRolling(TestCase):
 
     @skip_numba_jit
@@ -421,6 +461,18 @@ class TestRolling(TestCase):
 
         return self.assertEqual
 
+    def _test_rolling_series_with_gaps(self, test_impl, *args):
+        """Verify rolling method for windows spanning several chunks and runs of NaN and infinite values"""
+        hpat_func = self.jit(test_impl)
+
+        series = gen_series_with_gaps()
+        for window in [7, 64, 200]:
+            for min_periods in [0, window // 2, window - 1, window]:
+                with self.subTest(window=window, min_periods=min_periods, args=args):
+                    jit_result = hpat_func(series, window, min_periods, *args)
+                    ref_result = test_impl(series, window, min_periods, *args)
+                    pd.testing.assert_series_equal(jit_result, ref_result)
+
     def _test_rolling_unsupported_values(self, obj):
         def test_impl(obj, window, min_periods, center,
                       win_type, on, axis, closed):
@@ -1286,6 +1338,25 @@ class TestRolling(TestCase):
             series = pd.Series(data, index, name='A')
             self._test_rolling_apply_mean(series)
 
+    @skip_sdc_jit('Series.rolling.apply() unsupported Series index')
+    def test_series_rolling_apply_int_data(self):
+        """Verify func gets window of integer series as float values like in pandas"""
+        def test_impl(series, window, min_periods):
+            def func(x):
+                return x.sum() / 4 + x[0] * 0.5
+
+            return series.rolling(window, min_periods).apply(func, raw=True)
+
+        hpat_func = self.jit(test_impl)
+
+        series = pd.Series([3, -7, 0, 2 ** 53 + 1, 5, 1, -2 ** 40, 9, 4, 6], dtype=np.int64)
+        for window in range(1, len(series) + 2):
+            for min_periods in range(1, window + 1, 2):
+                with self.subTest(series=series, window=window, min_periods=min_periods):
+                    jit_result = hpat_func(series, window, min_periods)
+                    ref_result = test_impl(series, window, min_periods)
+                    pd.testing.assert_series_equal(jit_result, ref_result)
+
     @skip_sdc_jit('Series.rolling.apply() unsupported exceptions')
     def test_series_rolling_apply_unsupported_types(self):
         series = pd.Series([1., -1., 0., 0.1, -0.1])
@@ -1315,6 +1386,40 @@ class TestRolling(TestCase):
             other = pd.Series(other_data)
             self._test_rolling_corr(series, other)
 
+    @skip_sdc_jit('Series.rolling.corr() unsupported Series index')
+    def test_series_rolling_corr_shifted_data(self):
+        """Verify correlation is not spoiled by rounding errors of values far from the current ones"""
+        def test_impl(series, window, min_periods, other):
+            return series.rolling(window, min_periods).corr(other)
+
+        hpat_func = self.jit(test_impl)
+
+        np.random.seed(0)
+        other = pd.Series(np.random.normal(0, 1, 100))
+        all_data = [
+            1e6 + np.random.normal(0, 1, 100),
+            np.r_[np.zeros(20), 1e6 + np.random.normal(0, 1, 80)]
+        ]
+        for data in all_data:
+            series = pd.Series(data)
+            for window in [5, 10, 30]:
+                with self.subTest(series=series, window=window):
+                    jit_result = hpat_func(series, window, window, other)
+                    # correlation of every window is calculated from scratch
+                    ref_result = pd.Series([
+                        series[max(i + 1 - window, 0):i + 1].corr(other[max(i + 1 - window, 0):i + 1],
+                                                                  min_periods=window)
+                        for i in range(len(series))
+                    ])
+                    pd.testing.assert_series_equal(jit_result, ref_result)
+
+    @skip_sdc_jit('Series.rolling.corr() unsupported Series index')
+    def test_series_rolling_corr_single_pair(self):
+        """Verify correlation of window with single pair of finite values is NaN"""
+        series = pd.Series([8711.2, 1., 1., 9565.8, np.nan, 83.8])
+        other = pd.Series([np.nan, 6.011, 3.055, 9.209, np.nan, 2.869])
+        self._test_rolling_corr(series, other)
+
     @skip_sdc_jit('Series.rolling.corr() unsupported Series index')
     def test_series_rolling_corr_with_no_other(self):
         all_data = [
@@ -1360,6 +1465,25 @@ class TestRolling(TestCase):
             series = pd.Series(data, index, name='A')
             self._test_rolling_count(series)
 
+    @skip_sdc_jit('Series.rolling.count() unsupported Series index')
+    def test_series_rolling_count_series_with_gaps(self):
+        """Verify rolling count for empty windows and windows longer than chunks with runs of NaN values"""
+        def test_impl(series, window, min_periods):
+            return series.rolling(window, min_periods).count()
+
+        hpat_func = self.jit(test_impl)
+
+        series = gen_series_with_gaps()
+        for window in [0, 1, 7, 64, 200, len(series), 2 * len(series)]:
+            with self.subTest(window=window):
+                jit_result = hpat_func(series, window, 0)
+                if window == 0:
+                    # python implementation crashes if window = 0, empty window has no values to count
+                    ref_result = pd.Series(np.zeros(len(series)))
+                else:
+                    ref_result = test_impl(series, window, 0)
+                pd.testing.assert_series_equal(jit_result, ref_result)
+
     @skip_sdc_jit('Series.rolling.cov() unsupported Series index')
     def test_series_rolling_cov(self):
         all_data = [
@@ -1372,6 +1496,33 @@ class TestRolling(TestCase):
             other = pd.Series(other_data)
             self._test_rolling_cov(series, other)
 
+    @skip_sdc_jit('Series.rolling.cov() unsupported Series index')
+    def test_series_rolling_cov_shifted_data(self):
+        """Verify covariance is not spoiled by rounding errors of values far from the current ones"""
+        def test_impl(series, window, min_periods, other):
+            return series.rolling(window, min_periods).cov(other)
+
+        hpat_func = self.jit(test_impl)
+
+        np.random.seed(0)
+        other = pd.Series(np.random.normal(0, 1, 100))
+        all_data = [
+            1e6 + np.random.normal(0, 1, 100),
+            np.r_[np.zeros(20), 1e6 + np.random.normal(0, 1, 80)]
+        ]
+        for data in all_data:
+            series = pd.Series(data)
+            for window in [5, 10, 30]:
+                with self.subTest(series=series, window=window):
+                    jit_result = hpat_func(series, window, window, other)
+                    # covariance of every window is calculated from scratch
+                    ref_result = pd.Series([
+                        series[max(i + 1 - window, 0):i + 1].cov(other[max(i + 1 - window, 0):i + 1],
+                                                                 min_periods=window)
+                        for i in range(len(series))
+                    ])
+                    pd.testing.assert_series_equal(jit_result, ref_result)
+
     @skip_sdc_jit('Series.rolling.cov() unsupported Series index')
     def test_series_rolling_cov_no_other(self):
         all_data = [
@@ -1411,6 +1562,29 @@ class TestRolling(TestCase):
             series = pd.Series(data, index, name='A')
             self._test_rolling_kurt(series)
 
+    @skip_sdc_jit('Series.rolling.kurt() unsupported Series index')
+    def test_series_rolling_kurt_shifted_data(self):
+        """Verify kurtosis is not spoiled by rounding errors of values far from the current ones"""
+        def test_impl(series, window, min_periods):
+            return series.rolling(window, min_periods).kurt()
+
+        hpat_func = self.jit(test_impl)
+
+        np.random.seed(0)
+        all_data = [
+            1e6 + np.random.normal(0, 1, 100),
+            np.r_[np.zeros(20), 1e5 + np.random.normal(0, 1, 80)],
+            np.r_[1e6 + np.random.normal(0, 1, 20), np.random.normal(0, 1, 80)]
+        ]
+        for data in all_data:
+            series = pd.Series(data)
+            for window in [5, 10, 30]:
+                with self.subTest(series=series, window=window):
+                    jit_result = hpat_func(series, window, window)
+                    # kurtosis of every window is calculated from scratch
+                    ref_result = series.rolling(window, window).apply(lambda x: pd.Series(x).kurt(), raw=True)
+                    pd.testing.assert_series_equal(jit_result, ref_result)
+
     @skip_sdc_jit('Series.rolling.max() unsupported Series index')
     def test_series_rolling_max(self):
         all_data = test_global_input_data_float64
@@ -1419,6 +1593,10 @@ class TestRolling(TestCase):
             series = pd.Series(data, index, name='A')
             self._test_rolling_max(series)
 
+    @skip_sdc_jit('Series.rolling.max() unsupported Series index')
+    def test_series_rolling_max_series_with_gaps(self):
+        self._test_rolling_series_with_gaps(rolling_max_usecase)
+
     @skip_sdc_jit('Series.rolling.mean() unsupported Series index')
     def test_series_rolling_mean(self):
         all_data = [
@@ -1431,6 +1609,22 @@ class TestRolling(TestCase):
             series = pd.Series(data, index, name='A')
             self._test_rolling_mean(series)
 
+    @skip_sdc_jit('Series.rolling.mean() unsupported Series index')
+    def test_series_rolling_mean_large_magnitude_spread(self):
+        """Verify mean is not spoiled by rounding errors of big values added to and removed from the window"""
+        def test_impl(series, window, min_periods):
+            return series.rolling(window, min_periods).mean()
+
+        hpat_func = self.jit(test_impl)
+
+        series = gen_series_large_magnitude_spread()
+        for window in [3, 10, 1000]:
+            with self.subTest(window=window):
+                jit_result = hpat_func(series, window, window)
+                # mean of every window is calculated from scratch with exact summation
+                ref_result = series.rolling(window, window).apply(lambda x: math.fsum(x) / len(x), raw=True)
+                pd.testing.assert_series_equal(jit_result, ref_result)
+
     @skip_sdc_jit('Series.rolling.median() unsupported Series index')
     def test_series_rolling_median(self):
         all_data = test_global_input_data_float64
@@ -1439,6 +1633,10 @@ class TestRolling(TestCase):
             series = pd.Series(data, index, name='A')
             self._test_rolling_median(series)
 
+    @skip_sdc_jit('Series.rolling.median() unsupported Series index')
+    def test_series_rolling_median_series_with_gaps(self):
+        self._test_rolling_series_with_gaps(rolling_median_usecase)
+
     @skip_sdc_jit('Series.rolling.min() unsupported Series index')
     def test_series_rolling_min(self):
         all_data = test_global_input_data_float64
@@ -1447,6 +1645,10 @@ class TestRolling(TestCase):
             series = pd.Series(data, index, name='A')
             self._test_rolling_min(series)
 
+    @skip_sdc_jit('Series.rolling.min() unsupported Series index')
+    def test_series_rolling_min_series_with_gaps(self):
+        self._test_rolling_series_with_gaps(rolling_min_usecase)
+
     @skip_sdc_jit('Series.rolling.quantile() unsupported Series index')
     def test_series_rolling_quantile(self):
         all_data = [
@@ -1459,6 +1661,11 @@ class TestRolling(TestCase):
             series = pd.Series(data, index, name='A')
             self._test_rolling_quantile(series)
 
+    @skip_sdc_jit('Series.rolling.quantile() unsupported Series index')
+    def test_series_rolling_quantile_series_with_gaps(self):
+        for q in [0, 0.3, 0.5, 1]:
+            self._test_rolling_series_with_gaps(rolling_quantile_usecase, q)
+
     @skip_sdc_jit('Series.rolling.quantile() unsupported exceptions')
     def test_series_rolling_quantile_exception_unsupported_types(self):
         series = pd.Series([1., -1., 0., 0.1, -0.1])
@@ -1477,6 +1684,29 @@ class TestRolling(TestCase):
             series = pd.Series(data, index, name='A')
             self._test_rolling_skew(series)
 
+    @skip_sdc_jit('Series.rolling.skew() unsupported Series index')
+    def test_series_rolling_skew_shifted_data(self):
+        """Verify skewness is not spoiled by rounding errors of values far from the current ones"""
+        def test_impl(series, window, min_periods):
+            return series.rolling(window, min_periods).skew()
+
+        hpat_func = self.jit(test_impl)
+
+        np.random.seed(0)
+        all_data = [
+            1e6 + np.random.normal(0, 1, 100),
+            np.r_[np.zeros(20), 1e5 + np.random.normal(0, 1, 80)],
+            np.r_[1e6 + np.random.normal(0, 1, 20), np.random.normal(0, 1, 80)]
+        ]
+        for data in all_data:
+            series = pd.Series(data)
+            for window in [5, 10, 30]:
+                with self.subTest(series=series, window=window):
+                    jit_result = hpat_func(series, window, window)
+                    # skewness of every window is calculated from scratch
+                    ref_result = series.rolling(window, window).apply(lambda x: pd.Series(x).skew(), raw=True)
+                    pd.testing.assert_series_equal(jit_result, ref_result)
+
     @skip_sdc_jit('Series.rolling.std() unsupported Series index')
     def test_series_rolling_std(self):
         all_data = [
@@ -1506,6 +1736,22 @@ class TestRolling(TestCase):
             series = pd.Series(data, index, name='A')
             self._test_rolling_sum(series)
 
+    @skip_sdc_jit('Series.rolling.sum() unsupported Series index')
+    def test_series_rolling_sum_large_magnitude_spread(self):
+        """Verify sum is not spoiled by rounding errors of big values added to and removed from the window"""
+        def test_impl(series, window, min_periods):
+            return series.rolling(window, min_periods).sum()
+
+        hpat_func = self.jit(test_impl)
+
+        series = gen_series_large_magnitude_spread()
+        for window in [3, 10, 1000]:
+            with self.subTest(window=window):
+                jit_result = hpat_func(series, window, window)
+                # sum of every window is calculated from scratch with exact summation
+                ref_result = series.rolling(window, window).apply(math.fsum, raw=True)
+                pd.testing.assert_series_equal(jit_result, ref_result)
+
     @skip_sdc_jit('Series.rolling.var() unsupported Series index')
     def test_series_rolling_var(self):
         all_data = [
@@ -1518,6 +1764,27 @@ class TestRolling(TestCase):
             series = pd.Series(data, index, name='A')
             self._test_rolling_var(series)
 
+    @skip_sdc_jit('Series.rolling.var() unsupported Series index')
+    def test_series_rolling_var_shifted_data(self):
+        """Verify variance is not spoiled by rounding errors of values far from the current ones"""
+        test_impl = rolling_var_usecase
+        hpat_func = self.jit(test_impl)
+
+        np.random.seed(0)
+        all_data = [
+            1e6 + np.random.normal(0, 1e-2, 100),
+            np.r_[np.full(20, 1e6), np.random.normal(0, 1, 80)],
+            np.r_[np.random.normal(0, 1, 40), [1e8], np.random.normal(0, 1, 59)]
+        ]
+        for data in all_data:
+            series = pd.Series(data)
+            for window, ddof in product([5, 10, 30], [0, 1]):
+                with self.subTest(series=series, window=window, ddof=ddof):
+                    jit_result = hpat_func(series, window, 2, ddof)
+                    # variance of every window is calculated from scratch
+                    ref_result = series.rolling(window, 2).apply(lambda x: np.var(x, ddof=ddof), raw=True)
+                    pd.testing.assert_series_equal(jit_result, ref_result)
+
     @skip_sdc_jit('Series.rolling.var() unsupported exceptions')
     def test_series_rolling_var_exception_unsupported_ddof(self):
         series = pd.Series([1., -1., 0., 0.1, -0.1])
@@ -5583,6 +5583,46 @@ class TestSeries(
         B = pd.Series(np.arange(n)**2, index=['a', 'c', 'e', 'c', 'b', 'a', 'o'])
         pd.testing.assert_series_equal(hpat_func(A, B), test_impl(A, B), check_dtype=False, check_names=False)
 
+    @skip_parallel
+    @skip_sdc_jit('Arithmetic operations on Series with non-default indexes are not supported in old-style')
+    def test_series_operator_add_numeric_same_index_object(self):
+        """Verifies implementation of Series.operator.add between two numeric Series
+        referring to the same index object"""
+        def test_impl(A):
+            return A + A
+        hpat_func = self.jit(test_impl)
+
+        n = 7
+        A = pd.Series(np.arange(n), index=[3, 1, 1, 5, 0, 3, 2])
+        pd.testing.assert_series_equal(hpat_func(A), test_impl(A), check_dtype=False, check_names=False)
+
+    @skip_parallel
+    @skip_sdc_jit('Arithmetic operations on Series with non-default indexes are not supported in old-style')
+    def test_series_operator_add_numeric_align_index_str_diff_chars(self):
+        """Verifies implementation of Series.operator.add between two numeric Series
+        with string indexes of the same size but different total number of characters"""
+        def test_impl(A, B):
+            return A + B
+        hpat_func = self.jit(test_impl)
+
+        n = 5
+        A = pd.Series(np.arange(n), index=['a', 'bb', 'c', 'a', 'dd'])
+        B = pd.Series(np.arange(n)**2, index=['a', 'b', 'c', 'a', 'dd'])
+        pd.testing.assert_series_equal(hpat_func(A, B), test_impl(A, B), check_dtype=False, check_names=False)
+
+    @skip_parallel
+    @skip_sdc_jit('Arithmetic operations on Series with non-default indexes are not supported in old-style')
+    def test_series_operator_add_numeric_align_index_str_diff_len(self):
+        """Verifies implementation of Series.operator.add between two numeric Series
+        with string indexes of the same total number of characters but different sizes"""
+        def test_impl(A, B):
+            return A + B
+        hpat_func = self.jit(test_impl)
+
+        A = pd.Series(np.arange(4), index=['ab', 'c', 'd', 'ab'])
+        B = pd.Series(np.arange(5)**2, index=['a', 'b', 'c', 'd', 'ab'])
+        pd.testing.assert_series_equal(hpat_func(A, B), test_impl(A, B), check_dtype=False, check_names=False)
+
     @skip_parallel
     @skip_sdc_jit('Arithmetic operations on Series with non-default indexes are not supported in old-style')
     def test_series_operator_add_numeric_align_index_int(self):
@@ -5600,6 +5640,22 @@ class TestSeries(
         B = pd.Series(np.arange(n)**2, index=index_B)
         pd.testing.assert_series_equal(hpat_func(A, B), test_impl(A, B), check_dtype=False, check_names=False)
 
+    @skip_parallel
+    @skip_sdc_jit('Arithmetic operations on Series with non-default indexes are not supported in old-style')
+    def test_series_operator_add_numeric_align_index_int_sorted(self):
+        """Verifies implementation of Series.operator.add between two numeric Series
+        with non-equal already sorted integer indexes with duplicates"""
+        def test_impl(A, B):
+            return A + B
+        hpat_func = self.jit(test_impl)
+
+        n = 11
+        index_A = [0, 1, 1, 2, 3, 3, 3, 4, 6, 8, 9]
+        index_B = [0, 1, 1, 3, 4, 4, 5, 5, 6, 6, 9]
+        A = pd.Series(np.arange(n), index=index_A)
+        B = pd.Series(np.arange(n)**2, index=index_B)
+        pd.testing.assert_series_equal(hpat_func(A, B), test_impl(A, B), check_dtype=False, check_names=False)
+
     @skip_parallel
     @skip_sdc_jit('Arithmetic operations on Series with non-default indexes are not supported in old-style')
     def test_series_operator_add_numeric_align_index_str(self):
@@ -5902,6 +5958,52 @@ class TestSeries(
         B = pd.Series(['b', 'aa', '', 'b', 'o', None, 'oo'])
         pd.testing.assert_series_equal(hpat_func(A, B), test_impl(A, B))
 
+    @skip_sdc_jit
+    def test_series_operator_ne_str(self):
+        """Verifies implementation of Series.operator.ne between string Series and string Series or scalar"""
+        def test_impl(A, B):
+            return A != B
+        hpat_func = self.jit(test_impl)
+
+        A = pd.Series(['a', '', 'ae', 'b', 'cccc', 'oo', None, None])
+        B = pd.Series(['b', '', 'ae', 'bb', 'o', None, 'oo', None])
+        with self.subTest(left=A, right=B):
+            pd.testing.assert_series_equal(hpat_func(A, B), test_impl(A, B))
+
+        for scalar in ['ae', '', 'abc']:
+            with self.subTest(left=A, right=scalar):
+                pd.testing.assert_series_equal(hpat_func(A, scalar), test_impl(A, scalar))
+            with self.subTest(left=scalar, right=A):
+                pd.testing.assert_series_equal(hpat_func(scalar, A), test_impl(scalar, A))
+
+    @skip_sdc_jit
+    def test_series_operator_eq_ne_str_bytes(self):
+        """
+        Verifies Series.operator.eq/ne between two string Series with non-ASCII and empty strings, strings
+        with equal number of characters but different byte lengths and NA values
+        """
+        A = pd.Series(['abc', 'äbc', 'ab', 'aé', 'ab', '', '', 'a', '日本', None, 'x', None])
+        B = pd.Series(['abc', 'äbc', 'äb', 'ae', 'abc', '', 'a', '', '日本', 'x', None, None])
+
+        for operator in ('==', '!='):
+            test_impl = _make_func_use_binop1(operator)
+            hpat_func = self.jit(test_impl)
+            with self.subTest(operator=operator):
+                pd.testing.assert_series_equal(hpat_func(A, B), test_impl(A, B))
+
+    @skip_sdc_jit
+    def test_series_operator_comp_str_ordering(self):
+        """Verifies ordering comparison operators between two string Series with prefixes, non-ASCII and NA"""
+        A = pd.Series(['ab', 'abc', '', 'a', 'ж', 'ÿ', '😀', 'é', '日本', 'ab', None, 'b', None])
+        B = pd.Series(['abc', 'ab', 'a', '', 'z', 'Ā', '\uffff', 'f', '日', 'ab', 'a', None, None])
+
+        comparison_binops = ('<', '>', '<=', '>=')
+        for operator in comparison_binops:
+            test_impl = _make_func_use_binop1(operator)
+            hpat_func = self.jit(test_impl)
+            with self.subTest(operator=operator):
+                pd.testing.assert_series_equal(hpat_func(A, B), test_impl(A, B))
+
     @skip_sdc_jit("Series.str.istitle is not supported yet")
     def test_series_istitle_str(self):
         series = pd.Series(['Cat', 'dog', 'Bird'])
@@ -100,19 +100,35 @@ class TestDFRollingMethods(TestBase):
             'sum': [2 * 10 ** 5],
             'var': [2 * 10 ** 5],
         }
+        # generated frames are shared between tests as rolling methods do not modify them
+        cls.frames = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls.frames.clear()
 
     def _gen_df(self, data, columns_num=10):
         """Generate DataFrame based on input data"""
         return pandas.DataFrame({col: data for col in string.ascii_uppercase[:columns_num]})
 
+    def _get_df(self, key, gen_data, columns_num=10):
+        """Get DataFrame generated based on gen_data() result, reusing the one generated for the same key"""
+        frame_key = key + (columns_num,)
+        if frame_key not in self.frames:
+            self.frames[frame_key] = self._gen_df(gen_data(), columns_num=columns_num)
+
+        return self.frames[frame_key]
+
     def _test_case(self, pyfunc, name,
-                   input_data=test_global_input_data_float64,
+                   input_data=test_global_input_data_float64, input_data_name='float64',
                    columns_num=10, extra_data_num=0):
         """
         Test DataFrame.rolling method
         :param pyfunc: Python function to test which calls tested method inside
         :param name: name of the tested method, e.g. min
         :param input_data: initial data used for generating test data
+        :param input_data_name: name of initial data used as a key of generated DataFrames
         :param columns_num: number of columns in generated DataFrame
         :param extra_data_num: number of additionally generated DataFrames
         """
@@ -125,15 +141,18 @@ class TestDFRollingMethods(TestBase):
                 'test_name': f'DataFrame.rolling.{name}',
                 'data_size': data_length,
             }
-            data = perf_data_gen_fixed_len(input_data, full_input_data_length,
-                                           data_length)
-            test_data = self._gen_df(data, columns_num=columns_num)
+            test_data = self._get_df(
+                ('input', input_data_name, data_length),
+                lambda: perf_data_gen_fixed_len(input_data, full_input_data_length, data_length),
+                columns_num=columns_num)
 
             args = [test_data]
             for i in range(extra_data_num):
-                numpy.random.seed(i)
-                extra_data = numpy.random.ranf(data_length)
-                args.append(self._gen_df(extra_data, columns_num=columns_num))
+                def gen_extra_data():
+                    numpy.random.seed(i)
+                    return numpy.random.ranf(data_length)
+
+                args.append(self._get_df(('extra', i, data_length), gen_extra_data, columns_num=columns_num))
 
             record = base.copy()
             record['test_type'] = 'SDC'
@@ -156,7 +175,8 @@ class TestDFRollingMethods(TestBase):
         self._test_case(usecase, name, extra_data_num=extra_data_num)
 
     def test_df_rolling_apply_mean(self):
-        method_params = 'lambda x: np.nan if len(x) == 0 else x.mean()'
+        # windows are passed to func as ndarrays in SDC, so make pandas do the same
+        method_params = 'lambda x: np.nan if len(x) == 0 else x.mean(), raw=True'
         self._test_df_rolling_method('apply', method_params=method_params)
 
     def test_df_rolling_corr(self):